@@ -4,9 +4,19 @@ __version__ = '0.2.2'
 
 
 from .base import async_property
+from .batched import async_batched_property
 from .cached import async_cached_property
-from .loader import AwaitLoader
+from .loader import AwaitLoader, gather_loaded
 from .proxy import AwaitableOnly
+from .stream import async_stream_property
 
 
-__all__ = ['async_property', 'async_cached_property', 'AwaitLoader', 'AwaitableOnly']
+__all__ = [
+    'async_property',
+    'async_batched_property',
+    'async_cached_property',
+    'async_stream_property',
+    'AwaitLoader',
+    'AwaitableOnly',
+    'gather_loaded',
+]
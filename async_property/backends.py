@@ -0,0 +1,212 @@
+import asyncio
+import contextlib
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import time
+
+from async_property.cached import LRUCache
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class CacheBackend:
+    """
+    Interface for external caches used by async_cached_property(backend=...).
+    get() raises KeyError when the key is missing or expired.
+    """
+    async def get(self, key):
+        raise NotImplementedError
+
+    async def set(self, key, value, ttl=None):
+        raise NotImplementedError
+
+    async def delete(self, key):
+        raise NotImplementedError
+
+
+def get_expires(ttl):
+    return 0.0 if ttl is None else time.time() + ttl
+
+
+def is_expired(expires):
+    return expires and expires <= time.time()
+
+
+class LRUBackend(CacheBackend):
+    """In-process backend that keeps up to maxsize values in memory."""
+    def __init__(self, maxsize=1024, serializer=None):
+        self.cache = LRUCache(maxsize)
+        self.serializer = serializer
+
+    async def get(self, key):
+        expires, value = self.cache[key]
+        if is_expired(expires):
+            del self.cache[key]
+            raise KeyError(key)
+        if self.serializer is not None:
+            value = self.serializer.loads(value)
+        return value
+
+    async def set(self, key, value, ttl=None):
+        if self.serializer is not None:
+            value = self.serializer.dumps(value)
+        self.cache[key] = get_expires(ttl), value
+
+    async def delete(self, key):
+        self.cache.pop(key, None)
+
+
+class FileBackend(CacheBackend):
+    """
+    Stores each value in its own file under directory, so that
+    processes on the same host can share them. File access runs
+    in the default executor.
+    """
+    header = struct.Struct('d')
+
+    def __init__(self, directory, serializer=pickle):
+        self.directory = directory
+        self.serializer = serializer
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, key):
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, name)
+
+    async def get(self, key):
+        return await self.run(self.read, key)
+
+    async def set(self, key, value, ttl=None):
+        await self.run(self.write, key, value, ttl)
+
+    async def delete(self, key):
+        await self.run(self.remove, key)
+
+    def run(self, func, *args):
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(None, func, *args)
+
+    def read(self, key):
+        try:
+            with open(self.get_path(key), 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        expires, = self.header.unpack_from(data)
+        if is_expired(expires):
+            self.remove(key)
+            raise KeyError(key)
+        return self.serializer.loads(data[self.header.size:])
+
+    def write(self, key, value, ttl=None):
+        data = self.header.pack(get_expires(ttl))
+        data += self.serializer.dumps(value)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            os.replace(tmp_path, self.get_path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def remove(self, key):
+        try:
+            os.unlink(self.get_path(key))
+        except FileNotFoundError:
+            pass
+
+
+class MmapBackend(CacheBackend):
+    """
+    Append-only store in a memory-mapped file shared by processes on
+    the same host. Each process indexes new records as the file grows.
+    With serializer=None, values must be bytes-like and get() returns
+    a zero-copy memoryview into the map.
+    """
+    record = struct.Struct('<IId')
+    deleted = 0xFFFFFFFF
+
+    def __init__(self, path, serializer=pickle):
+        self.path = path
+        self.serializer = serializer
+        self.file = open(path, 'a+b', buffering=0)
+        self.map = None
+        self.index = {}
+        self.offset = 0
+
+    async def get(self, key):
+        self.refresh()
+        try:
+            start, length, expires = self.index[key]
+        except KeyError:
+            raise KeyError(key) from None
+        if is_expired(expires):
+            raise KeyError(key)
+        value = memoryview(self.map)[start:start + length]
+        if self.serializer is None:
+            return value
+        return self.serializer.loads(value)
+
+    async def set(self, key, value, ttl=None):
+        if self.serializer is not None:
+            value = self.serializer.dumps(value)
+        self.append(key, value, get_expires(ttl))
+
+    async def delete(self, key):
+        self.append(key, b'', 0.0, self.deleted)
+
+    def append(self, key, value, expires, length=None):
+        key = key.encode()
+        if length is None:
+            length = len(value)
+        data = self.record.pack(len(key), length, expires) + key + value
+        with self.lock():
+            view = memoryview(data)
+            while view:
+                view = view[self.file.write(view):]
+
+    @contextlib.contextmanager
+    def lock(self):
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self.file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+
+    def refresh(self):
+        """Indexes records appended since the last refresh"""
+        size = os.fstat(self.file.fileno()).st_size
+        if size <= self.offset:
+            return
+        if self.map is None or len(self.map) < size:
+            self.map = mmap.mmap(
+                self.file.fileno(), size, access=mmap.ACCESS_READ
+            )
+        while self.offset + self.record.size <= size:
+            key_length, length, expires = self.record.unpack_from(
+                self.map, self.offset
+            )
+            start = self.offset + self.record.size + key_length
+            end = start if length == self.deleted else start + length
+            if end > size:
+                break
+            key = self.map[start - key_length:start].decode()
+            if length == self.deleted:
+                self.index.pop(key, None)
+            else:
+                self.index[key] = start, length, expires
+            self.offset = end
+
+    def close(self):
+        self.file.close()
@@ -1,7 +1,8 @@
 import asyncio
 import functools
 
-from async_property.proxy import AwaitableOnly
+from async_property import metrics, tracing
+from async_property.proxy import BoundAwaitable
 
 is_coroutine = asyncio.iscoroutinefunction
 
@@ -31,14 +32,22 @@ class AsyncPropertyDescriptor:
     def __delete__(self, instance):
         raise ValueError(INVALID_ACTION.format('delete'))
 
+    def load_value(self, instance):
+        coro = self._fget(instance)
+        if metrics.callbacks:
+            coro = metrics.measure(coro, type(instance), self.field_name)
+        if tracing.tracer is not None:
+            coro = tracing.trace(coro, 'async_property.load', {
+                'class': type(instance).__qualname__,
+                'field': self.field_name,
+            })
+        return coro
+
     def get_loader(self, instance):
-        @functools.wraps(self._fget)
-        async def get_value():
-            return await self._fget(instance)
-        return get_value
+        return functools.partial(self.load_value, instance)
 
     def awaitable_only(self, instance):
-        return AwaitableOnly(self.get_loader(instance))
+        return BoundAwaitable(self, instance)
 
 
 INVALID_ACTION = 'Cannot {} @async_property. ' \
@@ -0,0 +1,87 @@
+import asyncio
+import functools
+import threading
+
+from async_property.cached import (
+    AsyncCachedPropertyDescriptor,
+    copy_error,
+)
+
+is_coroutine = asyncio.iscoroutinefunction
+
+
+def async_batched_property(func=None, *args, **kwargs):
+    if func is None:
+        return functools.partial(async_batched_property, **kwargs)
+    assert is_coroutine(func), 'Can only use with async def'
+    return AsyncBatchedPropertyDescriptor(func, *args, **kwargs)
+
+
+class AsyncBatchedPropertyDescriptor(AsyncCachedPropertyDescriptor):
+    """
+    Cached property whose function is called with a list of instances
+    and returns their values in the same order. Loads started in the
+    same event loop iteration are sent as one batch; each event loop
+    collects and dispatches its own batches.
+    """
+    def __init__(self, _fget, *args, max_batch_size=None, **kwargs):
+        super().__init__(_fget, *args, **kwargs)
+        if self.executor is not None:
+            raise AssertionError(
+                f'@{self.field_name} batched properties do not support '
+                'executor'
+            )
+        self.max_batch_size = max_batch_size
+        self.batches = {}
+        self.lock = threading.Lock()
+
+    def _get_kwargs(self):
+        kwargs = super()._get_kwargs()
+        kwargs.update(max_batch_size=self.max_batch_size)
+        return kwargs
+
+    def fetch_value(self, instance):
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        with self.lock:
+            batch = self.batches.setdefault(loop, [])
+            if not batch:
+                loop.call_soon(self.dispatch_batch, loop, batch)
+            batch.append((instance, future))
+            full = self.max_batch_size and len(batch) >= self.max_batch_size
+        if full:
+            self.dispatch_batch(loop, batch)
+        return future
+
+    def dispatch_batch(self, loop, batch):
+        """
+        Sends the batch unless it was already sent, e.g. once it was full,
+        in which case a newer batch for the loop waits for its own turn
+        """
+        with self.lock:
+            if self.batches.get(loop) is not batch:
+                return
+            del self.batches[loop]
+        asyncio.ensure_future(self.run_batch(batch))
+
+    async def run_batch(self, batch):
+        instances = [instance for instance, _ in batch]
+        try:
+            values = await self._fget(instances)
+            if len(values) != len(batch):
+                raise ValueError(
+                    f'@{self.field_name} returned {len(values)} values '
+                    f'for {len(batch)} instances'
+                )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(copy_error(exc))
+            return
+        for (_, future), value in zip(batch, values):
+            if not future.done():
+                future.set_result(value)
@@ -1,38 +1,283 @@
 import asyncio
+import atexit
+import concurrent.futures
+import copy
 import functools
-from collections import defaultdict
+import random
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
 
-from async_property.proxy import AwaitableOnly, AwaitableProxy
+from async_property import metrics, tracing
+from async_property.proxy import AwaitableProxy, BoundAwaitable
 
 is_coroutine = asyncio.iscoroutinefunction
 
 
 ASYNC_PROPERTY_ATTR = '__async_property__'
 
+# Instance states are created under one of these locks, picked by the
+# instance's id, so threads never replace each other's state while
+# unrelated instances rarely contend. Reading cached values is lock-free.
+creation_locks = tuple(threading.Lock() for _ in range(64))
 
-def async_cached_property(func, *args, **kwargs):
-    assert is_coroutine(func), 'Can only use with async def'
+
+def get_creation_lock(instance):
+    return creation_locks[id(instance) >> 4 & 63]
+
+
+# Loads are started and finished under one of these, picked by the
+# state's id, rather than a lock per state, which would add about 100
+# bytes to every loaded instance
+state_locks = tuple(threading.RLock() for _ in range(64))
+
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool():
+    """Returns the pool for executor='process', created on first use"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = concurrent.futures.ProcessPoolExecutor()
+            atexit.register(shutdown_process_pool)
+        return _process_pool
+
+
+def shutdown_process_pool(wait=True):
+    """Shuts down the executor='process' pool; the next load starts one"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        atexit.unregister(shutdown_process_pool)
+        pool.shutdown(wait=wait)
+
+
+def get_loop(future):
+    try:
+        return future.get_loop()
+    except AttributeError:  # Python 3.7
+        return future._loop
+
+
+def is_stalled(task):
+    """
+    True if the task's event loop is not running, e.g. a bridge thread's
+    loop after run_until_complete returned, so the task cannot finish
+    """
+    return not task.done() and not get_loop(task).is_running()
+
+
+def wait_on(task):
+    """
+    Waits on a task without cancelling it, also from a thread running
+    another event loop than the task's
+    """
+    task_loop = get_loop(task)
+    if task_loop is asyncio.get_event_loop():
+        return asyncio.shield(task)
+    future = concurrent.futures.Future()
+    callback = functools.partial(copy_result, future)
+    if task.done():
+        callback(task)
+        return asyncio.wrap_future(future)
+    try:
+        task_loop.call_soon_threadsafe(task.add_done_callback, callback)
+    except RuntimeError:
+        # the task's loop is closed, so the task is already done
+        callback(task)
+    return asyncio.wrap_future(future)
+
+
+def copy_result(future, task):
+    if task.cancelled():
+        future.cancel()
+    elif not future.set_running_or_notify_cancel():
+        return
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+def copy_error(exc):
+    """
+    Copies a stored error to raise again, so every raise gets its own
+    traceback instead of growing the one shared by all raisers. The
+    copy is chained to the original, which keeps the first traceback.
+    """
+    try:
+        error = copy.copy(exc)
+    except Exception:
+        return exc.with_traceback(None)
+    if type(error) is not type(exc):
+        return exc.with_traceback(None)
+    error.__cause__ = exc
+    error.__suppress_context__ = True
+    return error
+
+
+def retrieve_error(task):
+    """Marks a load's error as seen, as its starter's waiter got it"""
+    if not task.cancelled():
+        task.exception()
+
+
+class Transient:
+    """
+    Base for values held in an instance state, like buffered streams,
+    that are left out when the state is pickled or copied
+    """
+    __slots__ = ()
+
+
+class StrongRef:
+    """Stands in for a weak reference to values that do not support one"""
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+    __slots__ = 'value',
+
+
+def make_ref(value):
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        return StrongRef(value)
+
+
+def is_live(ref):
+    return ref is not None and (type(ref) is StrongRef or ref() is not None)
+
+
+def without_state(instance):
+    """
+    Returns a shallow copy of the instance without its cached property
+    state, so that sending it to a worker process does not pickle the
+    cached values
+    """
+    instance = copy.copy(instance)
+    try:
+        delattr(instance, ASYNC_PROPERTY_ATTR)
+    except AttributeError:
+        pass
+    return instance
+
+
+def call_getter(owner, field_name, instance):
+    """Runs a getter in a worker process, where it is looked up by name"""
+    return getattr(owner, field_name)._fget(instance)
+
+
+def async_cached_property(func=None, *args, **kwargs):
+    if func is None:
+        return functools.partial(async_cached_property, **kwargs)
+    if kwargs.get('executor') is None:
+        assert is_coroutine(func), 'Can only use with async def'
+    else:
+        assert not is_coroutine(func), 'executor requires a regular def'
+    if kwargs.get('shared_key') is not None:
+        return AsyncSharedCachedPropertyDescriptor(func, *args, **kwargs)
     return AsyncCachedPropertyDescriptor(func, *args, **kwargs)
 
 
-class AsyncCachedPropertyInstanceState:
+class AsyncCachedPropertyInstanceState(dict):
+    """
+    Maps field names to cached values. Expiry times, in-flight
+    loads and cached errors are only allocated while a field needs them,
+    and are created, started and cleared under the state's lock.
+    """
     def __init__(self):
-        self.cache = {}
-        self.lock = defaultdict(asyncio.Lock)
+        super().__init__()
+        self.expires = None
+        self.pending = None
+        self.errors = None
+
+    @property
+    def cache(self):
+        return self
+
+    @property
+    def lock(self):
+        return state_locks[id(self) >> 4 & 63]
+
+    def __reduce__(self):
+        """
+        Pickles and copies cached values and expiry times, but not
+        in-flight loads, cached errors, weak references or transient
+        values such as streams
+        """
+        items = [
+            (field, value) for field, value in self.items()
+            if not isinstance(value, (weakref.ref, Transient))
+        ]
+        slots = {'expires': self.expires}
+        return type(self), (), (None, slots), None, iter(items)
 
-    __slots__ = 'cache', 'lock'
+    __slots__ = 'expires', 'pending', 'errors', '__weakref__'
 
 
 class AsyncCachedPropertyDescriptor:
-    def __init__(self, _fget, _fset=None, _fdel=None, field_name=None):
+    def __init__(self, _fget, _fset=None, _fdel=None, field_name=None,
+                 ttl=None, stale_while_revalidate=False,
+                 on_refresh_error=None, raw_when_loaded=False,
+                 depends_on=(), timeout=None, cache_errors=None,
+                 retries=0, retry_backoff=0.1, retry_on=Exception,
+                 backend=None, backend_key=None, weak=False,
+                 maxsize=None, max_bytes=None, sizeof=sys.getsizeof,
+                 executor=None):
         self._fget = _fget
         self._fset = _fset
         self._fdel = _fdel
         self.field_name = field_name or _fget.__name__
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.on_refresh_error = on_refresh_error
+        self.raw_when_loaded = raw_when_loaded
+        if isinstance(depends_on, str):
+            depends_on = (depends_on,)
+        self.depends_on = tuple(depends_on)
+        self.timeout = timeout
+        self.cache_errors = cache_errors
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.retry_on = retry_on
+        self.backend = backend
+        self.backend_key = backend_key
+        self.weak = weak
+        self.executor = executor
+        self.size_limit = None
+        if maxsize is not None or max_bytes is not None:
+            self.size_limit = CacheSizeLimit(
+                maxsize, max_bytes, sizeof, self.evict_state
+            )
 
         functools.update_wrapper(self, _fget)
         self._check_method_sync(_fset, 'setter')
         self._check_method_sync(_fdel, 'deleter')
+        if stale_while_revalidate and ttl is None:
+            raise AssertionError(
+                f'@{self.field_name} stale_while_revalidate requires ttl'
+            )
+        if backend is not None and backend_key is None:
+            raise AssertionError(
+                f'@{self.field_name} backend requires backend_key'
+            )
+        if executor not in (None, 'thread', 'process') and not isinstance(
+            executor, concurrent.futures.Executor
+        ):
+            raise AssertionError(
+                f'@{self.field_name} executor must be '
+                "'thread', 'process' or an Executor"
+            )
 
     def __set_name__(self, owner, name):
         self.field_name = name
@@ -41,7 +286,22 @@ class AsyncCachedPropertyDescriptor:
         if instance is None:
             return self
         if self.has_cache_value(instance):
-            return self.already_loaded(instance)
+            try:
+                loaded = self.already_loaded(instance)
+            except KeyError:
+                # evicted by another thread since the check
+                pass
+            else:
+                if metrics.callbacks:
+                    metrics.emit(metrics.HIT, type(instance), self.field_name)
+                return loaded
+        if metrics.callbacks:
+            metrics.emit(metrics.MISS, type(instance), self.field_name)
+        if self.stale_while_revalidate and self.has_stale_value(instance):
+            try:
+                return self.revalidate(instance)
+            except KeyError:
+                pass
         return self.not_loaded(instance)
 
     def __set__(self, instance, value):
@@ -56,11 +316,48 @@ class AsyncCachedPropertyDescriptor:
 
     def setter(self, method):
         self._check_method_name(method, 'setter')
-        return type(self)(self._fget, method, self._fdel, self.field_name)
+        return self._replace(_fset=method)
 
     def deleter(self, method):
         self._check_method_name(method, 'deleter')
-        return type(self)(self._fget, self._fset, method, self.field_name)
+        return self._replace(_fdel=method)
+
+    def _replace(self, **changes):
+        kwargs = self._get_kwargs()
+        kwargs.update(changes)
+        return type(self)(**kwargs)
+
+    def _get_kwargs(self):
+        return dict(
+            _fget=self._fget,
+            _fset=self._fset,
+            _fdel=self._fdel,
+            field_name=self.field_name,
+            ttl=self.ttl,
+            stale_while_revalidate=self.stale_while_revalidate,
+            on_refresh_error=self.on_refresh_error,
+            raw_when_loaded=self.raw_when_loaded,
+            depends_on=self.depends_on,
+            timeout=self.timeout,
+            cache_errors=self.cache_errors,
+            retries=self.retries,
+            retry_backoff=self.retry_backoff,
+            retry_on=self.retry_on,
+            backend=self.backend,
+            backend_key=self.backend_key,
+            weak=self.weak,
+            executor=self.executor,
+            **self._get_size_limit_kwargs(),
+        )
+
+    def _get_size_limit_kwargs(self):
+        if self.size_limit is None:
+            return {}
+        return dict(
+            maxsize=self.size_limit.maxsize,
+            max_bytes=self.size_limit.max_bytes,
+            sizeof=self.size_limit.sizeof,
+        )
 
     def _check_method_name(self, method, method_type):
         if method.__name__ != self.field_name:
@@ -78,46 +375,503 @@ class AsyncCachedPropertyDescriptor:
         try:
             return getattr(instance, ASYNC_PROPERTY_ATTR)
         except AttributeError:
+            pass
+        with get_creation_lock(instance):
+            try:
+                return getattr(instance, ASYNC_PROPERTY_ATTR)
+            except AttributeError:
+                pass
             state = AsyncCachedPropertyInstanceState()
-            object.__setattr__(instance, ASYNC_PROPERTY_ATTR, state)
+            try:
+                object.__setattr__(instance, ASYNC_PROPERTY_ATTR, state)
+            except AttributeError:
+                raise AttributeError(
+                    f'{type(instance).__name__} must include '
+                    f'{ASYNC_PROPERTY_ATTR!r} in __slots__ '
+                    f'to use @{self.field_name}'
+                ) from None
             return state
 
-    def get_lock(self, instance):
-        lock = self.get_instance_state(instance).lock
-        return lock[self.field_name]
-
     def get_cache(self, instance):
-        return self.get_instance_state(instance).cache
+        return self.get_instance_state(instance)
+
+    def get_pending_load(self, instance):
+        pending = self.get_instance_state(instance).pending
+        if pending is None:
+            return None
+        return pending.get(self.field_name)
+
+    def get_expires(self, instance):
+        state = self.get_instance_state(instance)
+        expires = state.expires
+        if expires is None:
+            with state.lock:
+                if state.expires is None:
+                    state.expires = {}
+                expires = state.expires
+        return expires
 
     def has_cache_value(self, instance):
         cache = self.get_cache(instance)
+        if self.weak:
+            if not is_live(cache.get(self.field_name)):
+                return False
+        elif self.field_name not in cache:
+            return False
+        if self.ttl is None:
+            return True
+        expires = cache.expires
+        return expires is not None and \
+            expires.get(self.field_name, 0) > time.monotonic()
+
+    def has_stale_value(self, instance):
+        cache = self.get_cache(instance)
+        if self.weak:
+            return is_live(cache.get(self.field_name))
         return self.field_name in cache
 
     def get_cache_value(self, instance):
         cache = self.get_cache(instance)
+        if self.size_limit is not None:
+            self.size_limit.touch(cache)
+        if self.weak:
+            return cache[self.field_name]()
         return cache[self.field_name]
 
     def set_cache_value(self, instance, value):
         cache = self.get_cache(instance)
-        cache[self.field_name] = value
+        if self.ttl is not None:
+            # set before the value, which readers in other threads
+            # check first without a lock
+            expires = self.get_expires(instance)
+            expires[self.field_name] = time.monotonic() + self.ttl
+        cache[self.field_name] = make_ref(value) if self.weak else value
+        if self.size_limit is not None:
+            self.size_limit.add(cache, value)
+        if self.cache_errors is not None:
+            self.del_cache_error(instance)
 
     def del_cache_value(self, instance):
+        if self.cache_errors is not None:
+            self.del_cache_error(instance)
         cache = self.get_cache(instance)
         del cache[self.field_name]
+        if self.size_limit is not None:
+            self.size_limit.remove(cache)
+        if self.ttl is not None:
+            self.get_expires(instance).pop(self.field_name, None)
 
-    def get_loader(self, instance):
-        @functools.wraps(self._fget)
-        async def load_value():
-            async with self.get_lock(instance):
-                if self.has_cache_value(instance):
+    def dump_value(self, instance):
+        """
+        Returns (value, wall clock expiry or None) for snapshots,
+        or None if there is no value to dump
+        """
+        if self.weak or not self.has_cache_value(instance):
+            return None
+        expires = None
+        if self.ttl is not None:
+            expires = self.get_expires(instance)[self.field_name]
+            expires = time.time() + expires - time.monotonic()
+        return self.get_cache_value(instance), expires
+
+    def restore_value(self, instance, value, expires=None):
+        self.set_cache_value(instance, value)
+        if expires is not None and self.ttl is not None:
+            left = min(expires - time.time(), self.ttl)
+            expires = self.get_expires(instance)
+            expires[self.field_name] = time.monotonic() + left
+
+    def evict_state(self, state):
+        state.pop(self.field_name, None)
+        if state.expires is not None:
+            state.expires.pop(self.field_name, None)
+
+    def load_value(self, instance):
+        if tracing.tracer is not None:
+            return tracing.trace(
+                self.wait_for_value(instance), 'async_property.load', {
+                    'class': type(instance).__qualname__,
+                    'field': self.field_name,
+                    'cache.hit': self.has_cache_value(instance),
+                    'dedup': self.get_pending_load(instance) is not None,
+                },
+            )
+        return self.wait_for_value(instance)
+
+    async def wait_for_value(self, instance):
+        """
+        Returns the cached value or waits on the in-flight load.
+        Only one load per field runs at a time, in its own task, so
+        cancelling a waiter does not cancel the load for the others.
+        Waiters in other threads and event loops share the same load.
+        """
+        while True:
+            if self.has_cache_value(instance):
+                try:
                     return self.get_cache_value(instance)
-                value = await self._fget(instance)
-                self.__set__(instance, value)
-                return value
-        return load_value
+                except KeyError:
+                    # evicted by another thread since the check
+                    continue
+            waiting_since = None
+            waiter = None
+            task = self.get_pending_load(instance)
+            if task is None or is_stalled(task):
+                waiter = asyncio.get_event_loop().create_future()
+                task = self.start_load(instance, stalled=task, waiter=waiter)
+                if task is None:
+                    continue
+                if waiter.cancelled():
+                    # another thread started the load first
+                    waiter = None
+            elif metrics.callbacks:
+                metrics.emit(metrics.DEDUP, type(instance), self.field_name)
+                waiting_since = time.perf_counter()
+            try:
+                if waiter is None:
+                    value = await wait_on(task)
+                else:
+                    value = await waiter
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise
+                continue
+            if waiting_since is not None:
+                metrics.emit(
+                    metrics.WAIT, type(instance), self.field_name,
+                    time.perf_counter() - waiting_since,
+                )
+            return value
+
+    def start_load(self, instance, stalled=None, waiter=None):
+        """
+        Starts a load, or returns the one another thread just started.
+        Returns None if a load finished in the meantime, and raises
+        the cached error if it failed. A stalled load is replaced.
+        A load started here also sets its outcome on the waiter future,
+        which the starting caller awaits instead of shielding the task.
+        The waiter is cancelled if no load is started.
+        """
+        state = self.get_instance_state(instance)
+        with state.lock:
+            task = self.get_pending_load(instance)
+            if task is not None and task is not stalled or \
+                    self.has_cache_value(instance):
+                if waiter is not None:
+                    waiter.cancel()
+                return None if task is stalled else task
+            if self.cache_errors is not None:
+                exc = self.get_cache_error(instance)
+                if exc is not None:
+                    raise copy_error(exc)
+            task = asyncio.ensure_future(
+                self.complete_load(instance, state, waiter)
+            )
+            if waiter is not None:
+                task.add_done_callback(retrieve_error)
+            if state.pending is None:
+                state.pending = {}
+            state.pending[self.field_name] = task
+        return task
+
+    async def complete_load(self, instance, state, waiter=None):
+        """
+        Loads and caches the value. The pending task is removed from the
+        state it was added to, which a shared LRU may have evicted since.
+        """
+        try:
+            if self.backend is not None:
+                fetch = self.fetch_with_backend(instance)
+            else:
+                fetch = self.fetch_from_source(instance)
+            if metrics.callbacks:
+                fetch = metrics.measure(fetch, type(instance), self.field_name)
+            value = await fetch
+            self.__set__(instance, value)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(value)
+            return value
+        except Exception as exc:
+            if self.cache_errors is not None:
+                self.set_cache_error(instance, exc)
+            if waiter is not None and not waiter.done():
+                waiter.set_exception(exc)
+            raise
+        finally:
+            if waiter is not None:
+                waiter.cancel()
+            with state.lock:
+                pending = state.pending
+                # a stalled load may have been replaced by another one
+                if pending is not None and \
+                        pending.get(self.field_name) is asyncio.current_task():
+                    del pending[self.field_name]
+                    if not pending:
+                        state.pending = None
+
+    def get_backend_key(self, instance):
+        key = self.backend_key(instance)
+        return f'{self.__module__}.{self.__qualname__}:{key}'
+
+    async def fetch_with_backend(self, instance):
+        key = self.get_backend_key(instance)
+        try:
+            return await self.backend.get(key)
+        except KeyError:
+            pass
+        value = await self.fetch_from_source(instance)
+        await self.backend.set(key, value, self.ttl)
+        return value
+
+    async def invalidate(self, instance):
+        """Removes the value from the instance and from the backend"""
+        if self.backend is not None:
+            await self.backend.delete(self.get_backend_key(instance))
+        if self.has_stale_value(instance):
+            self.__delete__(instance)
+
+    def fetch_from_source(self, instance):
+        if self.retries:
+            return self.fetch_with_retry(instance)
+        return self.fetch_with_timeout(instance)
+
+    async def fetch_with_retry(self, instance):
+        attempt = 0
+        while True:
+            try:
+                return await self.fetch_with_timeout(instance)
+            except self.retry_on:
+                if attempt >= self.retries:
+                    raise
+            await asyncio.sleep(self.get_retry_delay(attempt))
+            attempt += 1
+
+    def get_retry_delay(self, attempt):
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, self.retry_backoff * 2 ** attempt)
+
+    def fetch_with_timeout(self, instance):
+        if self.timeout is None:
+            return self.fetch_value(instance)
+        return asyncio.wait_for(self.fetch_value(instance), self.timeout)
+
+    def fetch_value(self, instance):
+        if self.executor is None:
+            return self._fget(instance)
+        loop = asyncio.get_event_loop()
+        if self.executor == 'thread':
+            return loop.run_in_executor(None, self._fget, instance)
+        executor = self.executor
+        if executor == 'process':
+            executor = get_process_pool()
+        if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            return loop.run_in_executor(
+                executor, call_getter, type(instance), self.field_name,
+                without_state(instance),
+            )
+        return loop.run_in_executor(executor, self._fget, instance)
+
+    def set_cache_error(self, instance, exc):
+        state = self.get_instance_state(instance)
+        expires = time.monotonic() + self.cache_errors
+        with state.lock:
+            if state.errors is None:
+                state.errors = {}
+            state.errors[self.field_name] = exc, expires
+
+    def del_cache_error(self, instance):
+        state = self.get_instance_state(instance)
+        if state.errors is None:
+            return
+        with state.lock:
+            if state.errors is not None:
+                state.errors.pop(self.field_name, None)
+                if not state.errors:
+                    state.errors = None
+
+    def get_cache_error(self, instance):
+        errors = self.get_instance_state(instance).errors
+        if errors is None or self.field_name not in errors:
+            return None
+        exc, expires = errors[self.field_name]
+        if expires > time.monotonic():
+            return exc
+        self.del_cache_error(instance)
+        return None
+
+    def get_loader(self, instance):
+        return functools.partial(self.load_value, instance)
+
+    def revalidate(self, instance):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop to refresh on, so only return the stale value
+            return self.already_loaded(instance)
+        task = self.get_pending_load(instance)
+        if (task is None or is_stalled(task)) and (
+            self.cache_errors is None or self.get_cache_error(instance) is None
+        ):
+            try:
+                task = self.start_load(instance, stalled=task)
+            except Exception:
+                # the load failed in another thread and its error is cached
+                task = None
+            if task is not None and get_loop(task) is loop:
+                task.add_done_callback(
+                    functools.partial(self.refresh_done, instance)
+                )
+        return self.already_loaded(instance)
+
+    def refresh_done(self, instance, task):
+        if task.cancelled() or task.exception() is None:
+            return
+        if self.on_refresh_error is not None:
+            self.on_refresh_error(instance, task.exception())
+        else:
+            asyncio.get_event_loop().call_exception_handler({
+                'message': f'Error refreshing @{self.__qualname__}',
+                'exception': task.exception(),
+                'task': task,
+            })
 
     def already_loaded(self, instance):
+        if self.raw_when_loaded:
+            return self.get_cache_value(instance)
         return AwaitableProxy(self.get_cache_value(instance))
 
     def not_loaded(self, instance):
-        return AwaitableOnly(self.get_loader(instance))
+        return BoundAwaitable(self, instance)
+
+
+class LRUCache(OrderedDict):
+    """
+    Bounded OrderedDict whose lookups and updates take its lock.
+    get_or_create() finds existing keys without waiting for the lock.
+    """
+    def __init__(self, maxsize=128):
+        super().__init__()
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self.lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self._set(key, value)
+
+    def _set(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if self.maxsize is not None and len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def get_or_create(self, key, create):
+        value = self.get(key)
+        if value is not None:
+            # hits only reorder when the lock is free, so that threads
+            # hitting the same keys do not queue up behind each other
+            if self.lock.acquire(blocking=False):
+                try:
+                    if key in self:
+                        self.move_to_end(key)
+                finally:
+                    self.lock.release()
+            return value
+        with self.lock:
+            value = self.get(key)
+            if value is None:
+                value = create()
+                self._set(key, value)
+            else:
+                self.move_to_end(key)
+            return value
+
+
+class CacheSizeLimit:
+    """
+    Tracks the instance states holding a field's value and evicts the
+    least recently used ones beyond maxsize states or max_bytes total.
+    States are held by weak references so that dropping an instance
+    frees all of its cached values; their entries are removed on the
+    next change.
+    """
+    def __init__(self, maxsize=None, max_bytes=None, sizeof=sys.getsizeof,
+                 on_evict=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.RLock()
+        self.collected = []
+
+    def add(self, state, value):
+        size = 0 if self.max_bytes is None else self.sizeof(value)
+        ref = weakref.ref(state, functools.partial(self.collect, id(state)))
+        with self.lock:
+            self.remove(state)
+            self.entries[id(state)] = ref, size
+            self.total_bytes += size
+            while len(self.entries) > 1 and self.is_full():
+                _, (evicted, size) = self.entries.popitem(last=False)
+                self.total_bytes -= size
+                evicted = evicted()
+                if evicted is not None:
+                    self.on_evict(evicted)
+
+    def is_full(self):
+        if self.maxsize is not None and len(self.entries) > self.maxsize:
+            return True
+        return self.max_bytes is not None and \
+            self.total_bytes > self.max_bytes
+
+    def touch(self, state):
+        with self.lock:
+            if id(state) in self.entries:
+                self.entries.move_to_end(id(state))
+
+    def remove(self, state):
+        with self.lock:
+            self.remove_collected()
+            entry = self.entries.pop(id(state), None)
+            if entry is not None:
+                self.total_bytes -= entry[1]
+
+    def collect(self, key, ref):
+        # called from garbage collection, so only queue the removal
+        self.collected.append((key, ref))
+
+    def remove_collected(self):
+        while self.collected:
+            key, ref = self.collected.pop()
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self.entries[key]
+                self.total_bytes -= entry[1]
+
+
+class AsyncSharedCachedPropertyDescriptor(AsyncCachedPropertyDescriptor):
+    """
+    Shares cached values between all instances with the same shared_key.
+    The state for each key is kept in a bounded LRU on the descriptor.
+    """
+    def __init__(self, _fget, *args, shared_key, maxsize=128, **kwargs):
+        super().__init__(_fget, *args, **kwargs)
+        self.shared_key = shared_key
+        self.maxsize = maxsize
+        self.shared_cache = LRUCache(maxsize)
+
+    def _get_kwargs(self):
+        kwargs = super()._get_kwargs()
+        kwargs.update(shared_key=self.shared_key, maxsize=self.maxsize)
+        return kwargs
+
+    def get_instance_state(self, instance):
+        return self.shared_cache.get_or_create(
+            self.shared_key(instance), AsyncCachedPropertyInstanceState
+        )
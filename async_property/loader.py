@@ -1,16 +1,110 @@
 import asyncio
-from async_property.cached import AsyncCachedPropertyDescriptor
+import pickle
+import time
+
+from async_property import tracing
+from async_property.cached import (
+    ASYNC_PROPERTY_ATTR,
+    AsyncCachedPropertyDescriptor,
+)
 
 is_coroutine = asyncio.iscoroutinefunction
 
 
 AWAIT_LOADER_ATTR = '_async_property_loaders'
+AWAIT_SCHEDULE_ATTR = '_async_property_schedule'
 
 
 def get_loaders(instance):
     return getattr(instance, AWAIT_LOADER_ATTR, ())
 
 
+def get_schedule(instance):
+    return getattr(instance, AWAIT_SCHEDULE_ATTR, ())
+
+
+def get_descriptors(instance):
+    return {
+        field: get_loader.__self__
+        for field, get_loader in get_loaders(instance)
+    }
+
+
+def get_dependencies(loaders):
+    return {
+        field: get_loader.__self__.depends_on
+        for field, get_loader in loaders
+    }
+
+
+def build_schedule(loaders):
+    """
+    Groups loaders into waves so that every field is loaded
+    after the fields listed in its depends_on
+    """
+    dependencies = get_dependencies(loaders)
+    for field, depends_on in dependencies.items():
+        for dependency in depends_on:
+            if dependency not in dependencies:
+                raise AssertionError(
+                    f'@{field} depends on unknown field {dependency!r}'
+                )
+    schedule = []
+    done = set()
+    remaining = list(loaders)
+    while remaining:
+        wave = tuple(
+            (field, get_loader) for field, get_loader in remaining
+            if done.issuperset(dependencies[field])
+        )
+        if not wave:
+            cycle = ', '.join(field for field, _ in remaining)
+            raise AssertionError(f'Circular depends_on between: {cycle}')
+        schedule.append(wave)
+        done.update(field for field, _ in wave)
+        remaining = [item for item in remaining if item[0] not in done]
+    return tuple(schedule)
+
+
+def select_schedule(schedule, fields):
+    """Filters schedule to fields and the fields they depend on"""
+    dependencies = get_dependencies(
+        item for wave in schedule for item in wave
+    )
+    unknown = [field for field in fields if field not in dependencies]
+    if unknown:
+        raise ValueError(
+            f'Unknown @async_cached_property fields: {", ".join(unknown)}'
+        )
+    selected = set()
+    stack = list(fields)
+    while stack:
+        field = stack.pop()
+        if field not in selected:
+            selected.add(field)
+            stack.extend(dependencies[field])
+    schedule = (
+        tuple(item for item in wave if item[0] in selected)
+        for wave in schedule
+    )
+    return tuple(wave for wave in schedule if wave)
+
+
+def get_critical_path(instance):
+    """Returns the longest chain of depends_on fields, in load order"""
+    dependencies = get_dependencies(get_loaders(instance))
+    paths = {}
+    for wave in get_schedule(instance):
+        for field, _ in wave:
+            longest = max(
+                (paths[dependency] for dependency in dependencies[field]),
+                key=len,
+                default=(),
+            )
+            paths[field] = (*longest, field)
+    return max(paths.values(), key=len, default=())
+
+
 class AwaitLoaderMeta(type):
     def __new__(mcs, name, bases, attrs) -> type:
         loaders = {}
@@ -24,25 +118,206 @@ class AwaitLoaderMeta(type):
                     loaders[field] = get_loader
 
         attrs[AWAIT_LOADER_ATTR] = tuple(loaders.items())
+        attrs[AWAIT_SCHEDULE_ATTR] = build_schedule(attrs[AWAIT_LOADER_ATTR])
+        if loaders and '__slots__' in attrs and not any(
+            hasattr(base, ASYNC_PROPERTY_ATTR) for base in bases
+        ):
+            slots = attrs['__slots__']
+            if isinstance(slots, str):
+                slots = (slots,)
+            if ASYNC_PROPERTY_ATTR not in slots:
+                attrs['__slots__'] = (*slots, ASYNC_PROPERTY_ATTR)
         return super().__new__(mcs, name, bases, attrs)
 
 
+def check_concurrency(concurrency):
+    if concurrency is not None and concurrency < 1:
+        raise ValueError(f'concurrency must be at least 1, got {concurrency}')
+
+
+async def load_fields(instance, loaders, concurrency=None, limiter=None):
+    """
+    Runs the given loaders for instance. With a concurrency limit,
+    a fixed number of workers pull loaders as slots become free.
+    A shared limiter (semaphore) bounds loads across instances.
+    """
+    if concurrency is None or concurrency >= len(loaders):
+        await wait_all([
+            asyncio.create_task(_run_loader(instance, get_loader, limiter))
+            for field, get_loader
+            in loaders
+        ])
+        return
+    loaders = iter(loaders)
+    await wait_all([
+        asyncio.create_task(_load_worker(instance, loaders, limiter))
+        for _ in range(concurrency)
+    ])
+
+
+async def wait_all(tasks):
+    """
+    Waits for tasks and cancels them if the wait is cancelled, so that
+    no more loads are started. Loads already running are shared and
+    keep running.
+    """
+    try:
+        await asyncio.wait(tasks)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def _load_worker(instance, loaders, limiter):
+    # cancelling the worker cancels only its wait on the shared load
+    for field, get_loader in loaders:
+        try:
+            await _run_loader(instance, get_loader, limiter)
+        except Exception:
+            # a failed field does not stop the others, as with wait_all
+            pass
+
+
+async def _run_loader(instance, get_loader, limiter):
+    if limiter is None:
+        return await get_loader(instance)()
+    async with limiter:
+        return await get_loader(instance)()
+
+
+async def gather_loaded(instances, concurrency=100, fields=None):
+    """
+    Loads AwaitLoader instances and yields each one once it is loaded.
+    At most `concurrency` instances are in flight and at most
+    `concurrency` property loads run at once across all of them.
+    Workers wait while `concurrency` loaded instances are not consumed.
+    """
+    check_concurrency(concurrency)
+    instances = iter(instances)
+    limiter = asyncio.Semaphore(concurrency)
+    queue = asyncio.Queue(maxsize=concurrency)
+
+    async def worker():
+        try:
+            for instance in instances:
+                await instance._load(fields=fields, limiter=limiter)
+                await queue.put(instance)
+        except asyncio.CancelledError:
+            # an Exception on Python 3.7, and only sent to workers once
+            # the consumer is gone
+            raise
+        except Exception as exc:
+            await queue.put(exc)
+        else:
+            await queue.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        running = len(workers)
+        while running:
+            item = await queue.get()
+            if item is None:
+                running -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        for task in workers:
+            task.cancel()
+
+
 class AwaitLoader(metaclass=AwaitLoaderMeta):
+    __slots__ = ()
+
+    max_concurrency = None
+    load_timeout = None
+
     def __await__(self):
         return self._load().__await__()
 
-    async def _load(self):
+    async def load_with(self, concurrency=None, fields=None, timeout=None):
+        return await self._load(concurrency, fields, timeout=timeout)
+
+    async def only(self, *fields):
+        return await self._load(fields=fields)
+
+    def snapshot(self, fields=None, serializer=pickle):
+        """
+        Serializes the loaded cached property values, optionally limited
+        to the given fields. Weak, unloaded and expired fields are left out.
+        """
+        descriptors = get_descriptors(self)
+        if fields is None:
+            fields = descriptors
+        unknown = [field for field in fields if field not in descriptors]
+        if unknown:
+            raise ValueError(
+                f'Unknown @async_cached_property fields: {", ".join(unknown)}'
+            )
+        values = {}
+        for field in fields:
+            dumped = descriptors[field].dump_value(self)
+            if dumped is not None:
+                values[field] = dumped
+        return serializer.dumps((type(self).__qualname__, values))
+
+    def restore_snapshot(self, data, serializer=pickle):
+        """
+        Sets cached property values from snapshot() output without
+        calling their getters. Fields that no longer exist are ignored.
+        Only restore snapshots from trusted sources.
+        """
+        name, values = serializer.loads(data)
+        if name != type(self).__qualname__:
+            raise ValueError(
+                f'Snapshot of {name} cannot be restored '
+                f'into {type(self).__qualname__}'
+            )
+        descriptors = get_descriptors(self)
+        now = time.time()
+        for field, (value, expires) in values.items():
+            descriptor = descriptors.get(field)
+            if descriptor is None or descriptor.weak:
+                continue
+            if expires is not None and expires <= now:
+                continue
+            descriptor.restore_value(self, value, expires)
+        return self
+
+    @classmethod
+    def from_snapshot(cls, data, *args, serializer=pickle, **kwargs):
+        """Creates an instance with cls(*args, **kwargs) and restores it"""
+        return cls(*args, **kwargs).restore_snapshot(data, serializer)
+
+    async def _load(self, concurrency=None, fields=None, limiter=None,
+                    timeout=None):
         """
         Calls overridable async load method
         and then calls async property loaders
+        wave by wave, optionally limited to the given fields
         """
+        if timeout is None:
+            timeout = self.load_timeout
+        if concurrency is None:
+            concurrency = self.max_concurrency
+        check_concurrency(concurrency)
+        coro = self._load_schedule(concurrency, fields, limiter)
+        if tracing.tracer is not None:
+            coro = tracing.trace(coro, 'AwaitLoader.load', {
+                'class': type(self).__qualname__,
+            })
+        if timeout is None:
+            return await coro
+        return await asyncio.wait_for(coro, timeout)
+
+    async def _load_schedule(self, concurrency, fields, limiter):
+        schedule = get_schedule(self)
+        if fields is not None:
+            schedule = select_schedule(schedule, fields)
         if hasattr(self, 'load') and is_coroutine(self.load):
             await self.load()
-        loaders = get_loaders(self)
-        if loaders:
-            await asyncio.wait([
-                asyncio.create_task(get_loader(self)())
-                for field, get_loader
-                in loaders
-            ])
+        for wave in schedule:
+            await load_fields(self, wave, concurrency, limiter)
         return self
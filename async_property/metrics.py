@@ -0,0 +1,115 @@
+"""
+Registry of callbacks that receive property load events.
+
+Each callback is called as ``callback(event, owner, field_name, value)``
+where owner is the instance's class. ``value`` is a duration in seconds
+for LOAD and WAIT events and 1 for the others. Descriptors only build
+events while at least one callback is registered.
+"""
+import bisect
+import time
+from collections import defaultdict
+
+HIT = 'hit'
+MISS = 'miss'
+LOAD = 'load'
+WAIT = 'wait'
+DEDUP = 'dedup'
+ERROR = 'error'
+
+callbacks = []
+
+
+def register(callback):
+    callbacks.append(callback)
+    return callback
+
+
+def unregister(callback):
+    callbacks.remove(callback)
+
+
+def emit(event, owner, field_name, value=1):
+    for callback in callbacks:
+        callback(event, owner, field_name, value)
+
+
+async def measure(awaitable, owner, field_name):
+    """Awaits awaitable and emits its LOAD time, or an ERROR"""
+    started = time.perf_counter()
+    try:
+        value = await awaitable
+    except Exception:
+        emit(ERROR, owner, field_name)
+        raise
+    emit(LOAD, owner, field_name, time.perf_counter() - started)
+    return value
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def observe(self, value):
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def quantile(self, q):
+        """Returns the upper bound of the bucket holding quantile q"""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return bound
+        return self.max
+
+
+class HistogramCollector:
+    """
+    In-memory callback that keeps a histogram per class, field and event.
+    Register it with ``metrics.register(HistogramCollector())``.
+    """
+    bounds = (
+        0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10,
+    )
+
+    def __init__(self, bounds=None):
+        if bounds is not None:
+            self.bounds = tuple(bounds)
+        self.histograms = defaultdict(lambda: Histogram(self.bounds))
+
+    def __call__(self, event, owner, field_name, value):
+        self.histograms[owner.__qualname__, field_name, event].observe(value)
+
+    def get(self, owner, field_name, event):
+        return self.histograms[owner.__qualname__, field_name, event]
+
+    def report(self):
+        return [
+            dict(
+                owner=owner,
+                field=field_name,
+                event=event,
+                count=histogram.count,
+                mean=histogram.mean,
+                p50=histogram.quantile(0.5),
+                p99=histogram.quantile(0.99),
+                max=histogram.max,
+            )
+            for (owner, field_name, event), histogram
+            in sorted(self.histograms.items())
+        ]
+
+    def clear(self):
+        self.histograms.clear()
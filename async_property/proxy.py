@@ -14,6 +14,21 @@ class AwaitableOnly:
     __slots__ = ['_coro']
 
 
+class BoundAwaitable(AwaitableOnly):
+    """This calls descriptor.load_value(instance) on await."""
+    def __init__(self, descriptor, instance):
+        object.__setattr__(self, '_descriptor', descriptor)
+        object.__setattr__(self, '_instance', instance)
+
+    def __repr__(self):
+        return f'<AwaitableOnly "{self._descriptor.__qualname__}">'
+
+    def __await__(self):
+        return self._descriptor.load_value(self._instance).__await__()
+
+    __slots__ = ['_descriptor', '_instance']
+
+
 """Below taken from: https://github.com/GrahamDumpleton/wrapt/blob/master/src/wrapt/wrappers.py
 
 Copyright (c) 2013-2019, Graham Dumpleton
@@ -455,8 +470,8 @@ class AwaitableProxy(ObjectProxy):
     async def __aexit__(self, *args, **kwargs):
         return await self.__wrapped__.__aexit__(*args, **kwargs)
     
-    async def __aiter__(self):
-        return await self.__wrapped__.__aiter__()
-    
-    async def __anext__(self):
-        return await self.__wrapped__.__anext__()
+    def __aiter__(self):
+        return self.__wrapped__.__aiter__()
+
+    def __anext__(self):
+        return self.__wrapped__.__anext__()
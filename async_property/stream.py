@@ -0,0 +1,110 @@
+import asyncio
+import functools
+import inspect
+
+from async_property.cached import (
+    AsyncCachedPropertyDescriptor,
+    Transient,
+    copy_error,
+)
+
+
+def async_stream_property(func=None, *args, **kwargs):
+    if func is None:
+        return functools.partial(async_stream_property, **kwargs)
+    assert inspect.isasyncgenfunction(func), \
+        'Can only use with async generator functions'
+    return AsyncStreamPropertyDescriptor(func, *args, **kwargs)
+
+
+class AsyncStreamPropertyDescriptor:
+    """
+    Property for async generators. The generator is started once per
+    instance and every consumer replays the chunks buffered so far
+    before sharing the chunks still to come.
+    """
+    def __init__(self, _fget, field_name=None):
+        self._fget = _fget
+        self.field_name = field_name or _fget.__name__
+        functools.update_wrapper(self, _fget)
+
+    def __set_name__(self, owner, name):
+        self.field_name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        state = self.get_instance_state(instance)
+        stream = state.get(self.field_name)
+        if stream is None:
+            with state.lock:
+                stream = state.get(self.field_name)
+                if stream is None:
+                    stream = AsyncStream(self._fget(instance))
+                    state[self.field_name] = stream
+        return stream
+
+    def __set__(self, instance, value):
+        raise ValueError('Cannot set @async_stream_property')
+
+    def __delete__(self, instance):
+        """Drops the buffered stream so the next access starts over"""
+        self.get_instance_state(instance).pop(self.field_name, None)
+
+    get_instance_state = AsyncCachedPropertyDescriptor.get_instance_state
+
+
+class AsyncStream(Transient):
+    """
+    Async iterable over an async generator that buffers its chunks.
+    Each iteration starts from the first chunk, and the next chunk is
+    pulled once in its own task however many consumers are waiting.
+    Awaiting the stream returns the list of all chunks.
+    """
+    def __init__(self, agen):
+        self.agen = agen
+        self.chunks = []
+        self.done = False
+        self.error = None
+        self.pulling = None
+
+    def __repr__(self):
+        return f'<AsyncStream chunks={len(self.chunks)} done={self.done}>'
+
+    def __aiter__(self):
+        return self.replay()
+
+    def __await__(self):
+        return self.collect().__await__()
+
+    async def collect(self):
+        return [chunk async for chunk in self]
+
+    async def replay(self):
+        index = 0
+        while True:
+            if index < len(self.chunks):
+                yield self.chunks[index]
+                index += 1
+            elif self.done:
+                if self.error is not None:
+                    raise copy_error(self.error)
+                return
+            else:
+                await self.pull()
+
+    async def pull(self):
+        if self.pulling is None:
+            self.pulling = asyncio.ensure_future(self.pull_next())
+        await asyncio.shield(self.pulling)
+
+    async def pull_next(self):
+        try:
+            self.chunks.append(await self.agen.__anext__())
+        except StopAsyncIteration:
+            self.done = True
+        except Exception as exc:
+            self.error = exc
+            self.done = True
+        finally:
+            self.pulling = None
@@ -0,0 +1,100 @@
+"""
+Optional tracing of property loads.
+
+Set a tracer with ``set_tracer()``. Each awaited property load and
+each ``AwaitLoader`` load is wrapped in a span, and spans started while
+another span is active (including in tasks it creates) are linked to it
+as their parent. Nothing is traced while no tracer is set.
+"""
+import contextvars
+import itertools
+import time
+
+tracer = None
+
+current_span = contextvars.ContextVar('async_property_span', default=None)
+
+
+def set_tracer(new_tracer):
+    global tracer
+    tracer = new_tracer
+    return new_tracer
+
+
+class Span:
+    def set_attribute(self, key, value):
+        raise NotImplementedError
+
+    def record_exception(self, exc):
+        raise NotImplementedError
+
+    def end(self):
+        raise NotImplementedError
+
+
+class Tracer:
+    def start_span(self, name, attributes, parent=None):
+        """Returns a Span; parent is the active Span or None"""
+        raise NotImplementedError
+
+
+async def trace(awaitable, name, attributes):
+    span = tracer.start_span(name, attributes, current_span.get())
+    token = current_span.set(span)
+    try:
+        return await awaitable
+    except BaseException as exc:
+        span.record_exception(exc)
+        raise
+    finally:
+        current_span.reset(token)
+        span.end()
+
+
+class InMemorySpan(Span):
+    def __init__(self, exporter, span_id, name, attributes, parent):
+        self.exporter = exporter
+        self.span_id = span_id
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = parent
+        self.exception = None
+        self.start = time.perf_counter()
+        self.end_time = None
+
+    def __repr__(self):
+        return f'<InMemorySpan {self.span_id} {self.name} {self.attributes}>'
+
+    @property
+    def parent_id(self):
+        return self.parent.span_id if self.parent is not None else None
+
+    @property
+    def duration(self):
+        return self.end_time - self.start
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exc):
+        self.exception = exc
+
+    def end(self):
+        self.end_time = time.perf_counter()
+        self.exporter.spans.append(self)
+
+
+class InMemoryExporter(Tracer):
+    """Tracer that keeps finished spans in a list, for tests."""
+    def __init__(self):
+        self.spans = []
+        self.ids = itertools.count(1)
+
+    def start_span(self, name, attributes, parent=None):
+        return InMemorySpan(self, next(self.ids), name, attributes, parent)
+
+    def children(self, span):
+        return [child for child in self.spans if child.parent is span]
+
+    def clear(self):
+        self.spans.clear()
@@ -0,0 +1,48 @@
+"""
+Runs the benchmarks and prints or saves the results as JSON.
+
+    python -m benchmarks --output before.json
+    python -m benchmarks --compare before.json --threshold 1.2
+"""
+import argparse
+import json
+import sys
+
+from benchmarks import (  # noqa
+    bench_cached_read, bench_descriptor, bench_loader, bench_threads,
+)
+from benchmarks.runner import compare, run_benchmarks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('-k', dest='pattern', help='only run matching names')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write results to a JSON file')
+    parser.add_argument('--compare', help='compare with a saved JSON file')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='fail when new/old exceeds this ratio')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.pattern, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    for row in results:
+        print(f'{row["name"]:<45} {row["value"]:>14.9g} {row["unit"]}')
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        rows = compare(baseline, results, args.threshold)
+        print()
+        for name, old, new, ratio, regressed in rows:
+            flag = '  REGRESSION' if regressed else ''
+            print(f'{name:<45} {ratio:>6.2f}x{flag}')
+        if any(row[-1] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Compare cached reads through AwaitableProxy with raw_when_loaded=True.
+
+Run with: python -m benchmarks.bench_cached_read
+"""
+import asyncio
+import functools
+import timeit
+
+from async_property import async_cached_property, AwaitLoader
+
+from benchmarks.runner import benchmark
+
+
+class ProxyModel(AwaitLoader):
+    @async_cached_property
+    async def number(self):
+        return 42
+
+    @async_cached_property
+    async def mapping(self):
+        return {str(i): i for i in range(100)}
+
+
+class RawModel(AwaitLoader):
+    @async_cached_property(raw_when_loaded=True)
+    async def number(self):
+        return 42
+
+    @async_cached_property(raw_when_loaded=True)
+    async def mapping(self):
+        return {str(i): i for i in range(100)}
+
+
+def numeric(instance):
+    number = instance.number
+    total = 0
+    for i in range(100):
+        total += number * i + number
+    return total
+
+
+def dict_heavy(instance):
+    mapping = instance.mapping
+    total = 0
+    for key in ('1', '10', '50', '99') * 25:
+        if key in mapping:
+            total += mapping[key]
+    return total
+
+
+def get_only(instance):
+    return instance.number
+
+
+async def load(instance):
+    return await instance
+
+
+for bench in (get_only, numeric, dict_heavy):
+    for model, mode in ((ProxyModel, 'proxy'), (RawModel, 'raw')):
+        benchmark(f'proxy.{bench.__name__}.{mode}')(
+            lambda bench=bench, model=model: functools.partial(
+                bench, asyncio.run(load(model()))
+            )
+        )
+
+
+def main(number=2000):
+    proxy = asyncio.run(load(ProxyModel()))
+    raw = asyncio.run(load(RawModel()))
+    print(f'{"benchmark":<12} {"proxy (s)":>10} {"raw (s)":>10} '
+          f'{"speedup":>8}')
+    for bench in (get_only, numeric, dict_heavy):
+        proxy_time = timeit.timeit(lambda: bench(proxy), number=number)
+        raw_time = timeit.timeit(lambda: bench(raw), number=number)
+        print(f'{bench.__name__:<12} {proxy_time:>10.4f} {raw_time:>10.4f} '
+              f'{proxy_time / raw_time:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
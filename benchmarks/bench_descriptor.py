@@ -0,0 +1,53 @@
+"""Cold and warm __get__ on async_property and async_cached_property."""
+from async_property import async_cached_property, async_property
+
+from benchmarks.runner import benchmark
+
+
+class Model:
+    @async_property
+    async def plain(self):
+        return 1
+
+    @async_cached_property
+    async def cached(self):
+        return 1
+
+
+@benchmark('descriptor.async_property.get')
+def async_property_get():
+    instance = Model()
+    return lambda: instance.plain
+
+
+@benchmark('descriptor.async_property.await')
+def async_property_await():
+    instance = Model()
+
+    async def run():
+        return await instance.plain
+    return run
+
+
+@benchmark('descriptor.cached.cold_await')
+def cached_cold_await():
+    async def run():
+        return await Model().cached
+    return run
+
+
+@benchmark('descriptor.cached.warm_get', number=10000)
+def cached_warm_get():
+    instance = Model()
+    instance.cached = 1
+    return lambda: instance.cached
+
+
+@benchmark('descriptor.cached.warm_await')
+def cached_warm_await():
+    instance = Model()
+    instance.cached = 1
+
+    async def run():
+        return await instance.cached
+    return run
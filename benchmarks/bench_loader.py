@@ -0,0 +1,53 @@
+"""AwaitLoader with 1, 10 and 100 fields and gathering many instances."""
+import asyncio
+
+from async_property import async_cached_property, AwaitLoader
+
+from benchmarks.runner import benchmark
+
+
+def make_loader(num_fields):
+    attrs = {}
+    for i in range(num_fields):
+        async def field(self, i=i):
+            return i
+        field.__name__ = f'field_{i}'
+        attrs[field.__name__] = async_cached_property(field)
+    return type(f'Loader{num_fields}', (AwaitLoader,), attrs)
+
+
+LOADERS = {num_fields: make_loader(num_fields) for num_fields in (1, 10, 100)}
+
+
+def loader_benchmark(num_fields):
+    loader = LOADERS[num_fields]
+
+    async def run():
+        return await loader()
+    return run
+
+
+for num_fields in LOADERS:
+    benchmark(f'loader.fields_{num_fields}', number=100)(
+        lambda num_fields=num_fields: loader_benchmark(num_fields)
+    )
+
+
+@benchmark('loader.gather_1000_instances', number=5)
+def gather_instances():
+    loader = LOADERS[10]
+
+    async def run():
+        return await asyncio.gather(*[loader() for _ in range(1000)])
+    return run
+
+
+@benchmark('memory.loaded_instance_10_fields', number=1000, unit='bytes')
+def loaded_instance_memory():
+    loader = LOADERS[10]
+
+    def allocate():
+        async def load():
+            return await asyncio.gather(*[loader() for _ in range(1000)])
+        return asyncio.run(load())
+    return allocate
@@ -0,0 +1,65 @@
+"""
+Cached property hits and cold loads spread over 1 to 8 threads. Each run
+does the same total work, so on free-threaded builds the time per run
+should drop as threads are added; with the GIL it stays roughly flat.
+"""
+import asyncio
+import threading
+
+from async_property import async_cached_property
+
+from benchmarks.runner import benchmark
+
+THREADS = (1, 2, 4, 8)
+TOTAL_HITS = 80000
+TOTAL_LOADS = 8000
+
+
+class Model:
+    @async_cached_property
+    async def cached(self):
+        return 1
+
+
+def run_threads(num_threads, target):
+    threads = [
+        threading.Thread(target=target) for _ in range(num_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def hits_benchmark(num_threads):
+    instances = [Model() for _ in range(8)]
+    for instance in instances:
+        instance.cached = 1
+    hits = TOTAL_HITS // num_threads
+
+    def read():
+        for i in range(hits):
+            instances[i & 7].cached
+
+    return lambda: run_threads(num_threads, read)
+
+
+def loads_benchmark(num_threads):
+    loads = TOTAL_LOADS // num_threads
+
+    def load():
+        async def run():
+            for _ in range(loads):
+                await Model().cached
+        asyncio.run(run())
+
+    return lambda: run_threads(num_threads, load)
+
+
+for num_threads in THREADS:
+    benchmark(f'threads.cached_hits_{num_threads}', number=3)(
+        lambda num_threads=num_threads: hits_benchmark(num_threads)
+    )
+    benchmark(f'threads.cached_loads_{num_threads}', number=3)(
+        lambda num_threads=num_threads: loads_benchmark(num_threads)
+    )
@@ -0,0 +1,80 @@
+"""Registry and timing helpers shared by the benchmark modules."""
+import asyncio
+import gc
+import time
+import tracemalloc
+
+BENCHMARKS = []
+
+
+def benchmark(name, number=1000, unit='s'):
+    """
+    Registers a benchmark. The decorated function takes no arguments
+    and returns the callable to time (sync or async). With unit='bytes'
+    it returns a callable that allocates `number` objects instead.
+    """
+    def decorator(func):
+        BENCHMARKS.append((name, func, number, unit))
+        return func
+    return decorator
+
+
+def time_sync(run, number):
+    started = time.perf_counter()
+    for _ in range(number):
+        run()
+    return time.perf_counter() - started
+
+
+async def time_async(run, number):
+    started = time.perf_counter()
+    for _ in range(number):
+        await run()
+    return time.perf_counter() - started
+
+
+def measure_time(run, number, repeat):
+    if asyncio.iscoroutinefunction(run):
+        return min(
+            asyncio.run(time_async(run, number)) for _ in range(repeat)
+        ) / number
+    return min(time_sync(run, number) for _ in range(repeat)) / number
+
+
+def measure_bytes(allocate, number):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = allocate()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del objects
+    return size / number
+
+
+def run_benchmarks(pattern=None, repeat=5):
+    results = []
+    for name, func, number, unit in BENCHMARKS:
+        if pattern and pattern not in name:
+            continue
+        run = func()
+        if unit == 'bytes':
+            value = measure_bytes(run, number)
+        else:
+            value = measure_time(run, number, repeat)
+        results.append(dict(name=name, value=value, unit=unit))
+    return results
+
+
+def compare(baseline, results, threshold):
+    """Returns rows of (name, old, new, ratio, regressed)"""
+    old_values = {row['name']: row['value'] for row in baseline}
+    rows = []
+    for row in results:
+        old = old_values.get(row['name'])
+        if not old:
+            continue
+        ratio = row['value'] / old
+        rows.append((row['name'], old, row['value'], ratio, ratio > threshold))
+    return rows
@@ -121,3 +121,24 @@ async def test_async_setter():
             @foo.setter
             async def foo(self, value):
                 pass
+
+
+async def test_loader():
+    instance = MyModel()
+    loader = MyModel.foo.get_loader(instance)
+    assert await loader() == 'bar'
+    assert 'foo' in instance.__async_property__.cache
+
+
+class RawModel:
+    @async_cached_property(raw_when_loaded=True)
+    async def foo(self):
+        return {'a': 1}
+
+
+async def test_raw_when_loaded():
+    instance = RawModel()
+    assert isinstance(instance.foo, AwaitableOnly)
+    assert await instance.foo == {'a': 1}
+    assert type(instance.foo) is dict
+    assert instance.foo['a'] == 1
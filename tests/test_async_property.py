@@ -49,3 +49,14 @@ async def test_sync_error():
             @async_property
             def foo(self):
                 return 'bar'
+
+
+async def test_awaitable_repr():
+    instance = MyModel()
+    assert repr(instance.foo) == '<AwaitableOnly "MyModel.foo">'
+
+
+async def test_awaitable_reused():
+    awaitable = MyModel().foo
+    assert await awaitable == 'bar'
+    assert await awaitable == 'bar'
@@ -62,3 +62,40 @@ async def test_await_concurrent():
     duration = time.time() - start
     assert instance.num_loaded == 3
     assert 0.3 <= duration < 0.4
+
+
+async def test_no_pending_after_load():
+    instance = MyModel()
+    await instance.first
+    assert instance.__async_property__.pending is None
+
+
+class FailingModel:
+    def __init__(self):
+        self.num_loaded = 0
+
+    @async_cached_property
+    async def first(self):
+        await asyncio.sleep(0.05)
+        self.num_loaded += 1
+        raise ValueError('failed')
+
+
+async def test_error_shared_with_waiters():
+    instance = FailingModel()
+    results = await asyncio.gather(instance.first, instance.first,
+                                   return_exceptions=True)
+    assert instance.num_loaded == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert instance.__async_property__.pending is None
+
+
+async def test_cancelled_waiter_does_not_cancel_load():
+    instance = MyModel()
+    first = asyncio.ensure_future(instance.first)
+    second = asyncio.ensure_future(instance.first)
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second is None
+    assert first.cancelled()
+    assert instance.num_loaded == 1
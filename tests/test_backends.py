@@ -0,0 +1,172 @@
+import asyncio
+import json
+
+import pytest
+
+from async_property import async_cached_property
+from async_property.backends import FileBackend, LRUBackend, MmapBackend
+
+pytestmark = pytest.mark.asyncio
+
+
+lru_backend = LRUBackend(maxsize=2)
+
+
+class MyModel:
+    calls = []
+
+    def __init__(self, id):
+        self.id = id
+
+    @async_cached_property(
+        backend=lru_backend,
+        backend_key=lambda self: self.id,
+    )
+    async def foo(self):
+        self.calls.append(self.id)
+        return {'id': self.id}
+
+
+def make_model(backend, ttl=None):
+    class FileModel:
+        calls = []
+
+        def __init__(self, id):
+            self.id = id
+
+        @async_cached_property(
+            backend=backend,
+            backend_key=lambda self: self.id,
+            ttl=ttl,
+        )
+        async def foo(self):
+            self.calls.append(self.id)
+            return {'id': self.id}
+
+    return FileModel
+
+
+@pytest.fixture(autouse=True)
+def reset_model():
+    MyModel.calls.clear()
+    lru_backend.cache.clear()
+
+
+async def test_backend_key():
+    assert MyModel.foo.get_backend_key(MyModel(1)) == \
+        'tests.test_backends.MyModel.foo:1'
+
+
+async def test_lru_backend_shared():
+    assert await MyModel(1).foo == {'id': 1}
+    assert await MyModel(1).foo == {'id': 1}
+    assert MyModel.calls == [1]
+
+
+async def test_lru_backend_eviction():
+    for id in (1, 2, 3, 1):
+        await MyModel(id).foo
+    assert MyModel.calls == [1, 2, 3, 1]
+
+
+async def test_invalidate():
+    instance = MyModel(1)
+    await instance.foo
+    await MyModel.foo.invalidate(instance)
+    assert 'foo' not in instance.__async_property__
+    assert await MyModel(1).foo == {'id': 1}
+    assert MyModel.calls == [1, 1]
+
+
+async def test_lru_backend_serializer():
+    backend = LRUBackend(serializer=json)
+    await backend.set('key', {'a': 1})
+    assert backend.cache['key'][1] == '{"a": 1}'
+    assert await backend.get('key') == {'a': 1}
+
+
+async def test_file_backend(tmp_path):
+    model = make_model(FileBackend(str(tmp_path)))
+    assert await model(1).foo == {'id': 1}
+    other_process = make_model(FileBackend(str(tmp_path)))
+    assert await other_process(1).foo == {'id': 1}
+    assert model.calls == [1]
+    assert other_process.calls == []
+
+
+async def test_file_backend_ttl(tmp_path):
+    backend = FileBackend(str(tmp_path))
+    await backend.set('key', 'value', ttl=0.01)
+    assert await backend.get('key') == 'value'
+    await asyncio.sleep(0.02)
+    with pytest.raises(KeyError):
+        await backend.get('key')
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_file_backend_delete(tmp_path):
+    backend = FileBackend(str(tmp_path))
+    await backend.set('key', 'value')
+    await backend.delete('key')
+    await backend.delete('key')
+    with pytest.raises(KeyError):
+        await backend.get('key')
+
+
+async def test_requires_backend_key():
+    with pytest.raises(AssertionError):
+        class BadModel:
+            @async_cached_property(backend=lru_backend)
+            async def foo(self):
+                return True
+
+
+async def test_mmap_backend_shared(tmp_path):
+    path = str(tmp_path / 'cache.bin')
+    model = make_model(MmapBackend(path))
+    assert await model(1).foo == {'id': 1}
+    other_process = make_model(MmapBackend(path))
+    assert await other_process(1).foo == {'id': 1}
+    assert model.calls == [1]
+    assert other_process.calls == []
+
+
+async def test_mmap_backend_zero_copy(tmp_path):
+    backend = MmapBackend(str(tmp_path / 'cache.bin'), serializer=None)
+    await backend.set('key', b'value')
+    value = await backend.get('key')
+    assert isinstance(value, memoryview)
+    assert value == b'value'
+
+
+async def test_mmap_backend_overwrite_and_delete(tmp_path):
+    path = str(tmp_path / 'cache.bin')
+    writer = MmapBackend(path)
+    reader = MmapBackend(path)
+    await writer.set('key', 'first')
+    assert await reader.get('key') == 'first'
+    await writer.set('key', 'second')
+    assert await reader.get('key') == 'second'
+    await writer.delete('key')
+    with pytest.raises(KeyError):
+        await reader.get('key')
+
+
+async def test_mmap_backend_ttl(tmp_path):
+    backend = MmapBackend(str(tmp_path / 'cache.bin'))
+    await backend.set('key', 'value', ttl=0.01)
+    assert await backend.get('key') == 'value'
+    await asyncio.sleep(0.02)
+    with pytest.raises(KeyError):
+        await backend.get('key')
+
+
+async def test_mmap_backend_partial_record(tmp_path):
+    path = tmp_path / 'cache.bin'
+    backend = MmapBackend(str(path))
+    await backend.set('key', 'value')
+    data = path.read_bytes()
+    path.write_bytes(data + data[:-3])
+    reader = MmapBackend(str(path))
+    assert await reader.get('key') == 'value'
+    assert reader.offset == len(data)
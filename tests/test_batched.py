@@ -0,0 +1,139 @@
+import asyncio
+import threading
+
+import pytest
+
+from async_property import async_batched_property, AwaitLoader
+from async_property.batched import AsyncBatchedPropertyDescriptor
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel(AwaitLoader):
+    batches = []
+
+    def __init__(self, id):
+        self.id = id
+
+    @async_batched_property
+    async def foo(instances):
+        MyModel.batches.append([instance.id for instance in instances])
+        return [instance.id * 10 for instance in instances]
+
+    @async_batched_property(max_batch_size=2)
+    async def bar(instances):
+        return [instance.id for instance in instances]
+
+
+class PairModel:
+    batches = []
+
+    def __init__(self, id):
+        self.id = id
+
+    @async_batched_property(max_batch_size=2)
+    async def foo(instances):
+        PairModel.batches.append([instance.id for instance in instances])
+        return [instance.id for instance in instances]
+
+
+class FailingModel:
+    @async_batched_property
+    async def foo(instances):
+        raise ValueError('backend down')
+
+
+class WrongLengthModel:
+    @async_batched_property
+    async def foo(instances):
+        return []
+
+
+@pytest.fixture(autouse=True)
+def reset_batches():
+    MyModel.batches.clear()
+
+
+async def test_descriptor():
+    assert isinstance(MyModel.foo, AsyncBatchedPropertyDescriptor)
+
+
+async def test_single_instance():
+    instance = MyModel(1)
+    assert await instance.foo == 10
+    assert instance.foo == 10
+    assert MyModel.batches == [[1]]
+
+
+async def test_gather_is_batched():
+    instances = await asyncio.gather(*[MyModel(id) for id in range(5)])
+    assert [instance.foo for instance in instances] == [0, 10, 20, 30, 40]
+    assert MyModel.batches == [[0, 1, 2, 3, 4]]
+
+
+async def test_same_instance_deduplicated():
+    instance = MyModel(1)
+    await asyncio.gather(instance.foo, instance.foo, MyModel(2).foo)
+    assert MyModel.batches == [[1, 2]]
+
+
+async def test_max_batch_size():
+    instances = [MyModel(id) for id in range(5)]
+    values = await asyncio.gather(*[instance.bar for instance in instances])
+    assert values == [0, 1, 2, 3, 4]
+    assert MyModel.bar.batches == {}
+
+
+async def test_full_batch_does_not_send_next_batch():
+    loop = asyncio.get_event_loop()
+    fetch = PairModel.foo.fetch_value
+    futures = [fetch(PairModel(0)), fetch(PairModel(1))]
+    # runs after the first batch's scheduled dispatch, before the second's
+    loop.call_soon(lambda: futures.append(fetch(PairModel(3))))
+    futures.append(fetch(PairModel(2)))
+    await asyncio.sleep(0.01)
+    assert await asyncio.gather(*futures) == [0, 1, 2, 3]
+    assert PairModel.batches == [[0, 1], [2, 3]]
+
+
+async def test_executor_not_supported():
+    with pytest.raises(AssertionError, match='executor'):
+        async_batched_property(MyModel.foo._fget, executor='thread')
+
+
+async def test_batch_error():
+    results = await asyncio.gather(FailingModel().foo, FailingModel().foo,
+                                   return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_batch_error_per_future():
+    results = await asyncio.gather(FailingModel().foo, FailingModel().foo,
+                                   return_exceptions=True)
+    assert results[0] is not results[1]
+    assert results[0].__cause__ is results[1].__cause__
+
+
+async def test_wrong_length():
+    with pytest.raises(ValueError):
+        await WrongLengthModel().foo
+
+
+async def test_batches_per_event_loop():
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def run(id):
+        async def load():
+            barrier.wait()
+            return await asyncio.wait_for(MyModel(id).foo, 1)
+        results[id] = asyncio.run(load())
+
+    threads = [threading.Thread(target=run, args=(id,)) for id in (1, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {1: 10, 2: 20}
+    assert sorted(MyModel.batches) == [[1], [2]]
+    assert MyModel.foo.batches == {}
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from async_property import async_cached_property, AwaitLoader, gather_loaded
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel(AwaitLoader):
+    max_concurrency = 2
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def track(self):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return True
+
+    @async_cached_property
+    async def first(self):
+        return await self.track()
+
+    @async_cached_property
+    async def second(self):
+        return await self.track()
+
+    @async_cached_property
+    async def third(self):
+        return await self.track()
+
+    @async_cached_property
+    async def fourth(self):
+        return await self.track()
+
+
+class FailingModel(MyModel):
+    @async_cached_property
+    async def first(self):
+        raise ValueError('failed')
+
+
+async def test_class_max_concurrency():
+    instance = await MyModel()
+    assert instance.max_running == 2
+    assert len(instance.__async_property__) == 4
+
+
+async def test_load_with_concurrency():
+    instance = await MyModel().load_with(concurrency=1)
+    assert instance.max_running == 1
+    assert len(instance.__async_property__) == 4
+
+
+async def test_load_with_unbounded():
+    instance = await MyModel().load_with(concurrency=10)
+    assert instance.max_running == 4
+
+
+async def test_failure_does_not_stop_workers():
+    instance = await FailingModel().load_with(concurrency=1)
+    assert set(instance.__async_property__) == {'second', 'third', 'fourth'}
+
+
+class NoConcurrency(MyModel):
+    max_concurrency = 0
+
+
+async def test_zero_concurrency():
+    with pytest.raises(ValueError, match='at least 1'):
+        await MyModel().load_with(concurrency=0)
+    with pytest.raises(ValueError, match='at least 1'):
+        await NoConcurrency()
+    with pytest.raises(ValueError, match='at least 1'):
+        async for instance in gather_loaded([MyModel()], concurrency=0):
+            pass
@@ -0,0 +1,79 @@
+import pytest
+
+from async_property import async_cached_property, AwaitLoader
+from async_property.loader import get_critical_path, get_schedule
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel(AwaitLoader):
+    def __init__(self):
+        self.order = []
+
+    @async_cached_property(depends_on=['user'])
+    async def posts(self):
+        self.order.append('posts')
+        return f'posts for {await self.user}'
+
+    @async_cached_property(depends_on=['user', 'posts'])
+    async def summary(self):
+        self.order.append('summary')
+        return f'{await self.posts} ({await self.settings})'
+
+    @async_cached_property
+    async def user(self):
+        self.order.append('user')
+        return 'user'
+
+    @async_cached_property
+    async def settings(self):
+        self.order.append('settings')
+        return 'settings'
+
+
+def schedule_fields(schedule):
+    return [[field for field, _ in wave] for wave in schedule]
+
+
+async def test_schedule():
+    assert schedule_fields(get_schedule(MyModel)) == [
+        ['user', 'settings'],
+        ['posts'],
+        ['summary'],
+    ]
+
+
+async def test_load_order():
+    instance = await MyModel()
+    assert instance.order == ['user', 'settings', 'posts', 'summary']
+    assert instance.summary == 'posts for user (settings)'
+
+
+async def test_only_loads_dependencies():
+    instance = await MyModel().only('posts')
+    assert instance.order == ['user', 'posts']
+
+
+async def test_critical_path():
+    assert get_critical_path(MyModel) == ('user', 'posts', 'summary')
+    assert get_critical_path(AwaitLoader) == ()
+
+
+async def test_unknown_dependency():
+    with pytest.raises(AssertionError):
+        class BadModel(AwaitLoader):
+            @async_cached_property(depends_on='missing')
+            async def foo(self):
+                return True
+
+
+async def test_circular_dependency():
+    with pytest.raises(AssertionError):
+        class CircularModel(AwaitLoader):
+            @async_cached_property(depends_on='bar')
+            async def foo(self):
+                return True
+
+            @async_cached_property(depends_on='foo')
+            async def bar(self):
+                return True
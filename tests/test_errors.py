@@ -0,0 +1,109 @@
+import asyncio
+import gc
+import traceback
+
+import pytest
+
+from async_property import async_cached_property
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel:
+    def __init__(self, failures=100):
+        self.failures = failures
+        self.num_calls = 0
+
+    async def call_backend(self):
+        self.num_calls += 1
+        if self.num_calls <= self.failures:
+            raise ValueError('backend down')
+        return 'bar'
+
+    @async_cached_property(cache_errors=0.05)
+    async def cached(self):
+        return await self.call_backend()
+
+    @async_cached_property(retries=2, retry_backoff=0.001)
+    async def retried(self):
+        return await self.call_backend()
+
+    @async_cached_property(retries=2, retry_backoff=0.001, retry_on=KeyError)
+    async def not_retried(self):
+        return await self.call_backend()
+
+
+async def test_error_is_cached():
+    instance = MyModel()
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            await instance.cached
+    assert instance.num_calls == 1
+
+
+async def test_cached_error_traceback_does_not_grow():
+    instance = MyModel()
+    errors, depths = [], []
+    for _ in range(3):
+        with pytest.raises(ValueError) as exc_info:
+            await instance.cached
+        errors.append(exc_info.value)
+        tb = exc_info.value.__traceback__
+        depths.append(len(traceback.extract_tb(tb)))
+    assert depths[1] == depths[2]
+    assert errors[1] is not errors[2]
+    assert errors[1].__cause__ is errors[2].__cause__ is errors[0]
+
+
+async def test_failed_load_error_is_retrieved(caplog):
+    instance = MyModel()
+    with pytest.raises(ValueError):
+        await instance.retried
+    await asyncio.sleep(0)
+    gc.collect()
+    assert 'never retrieved' not in caplog.text
+
+
+async def test_cached_error_expires():
+    instance = MyModel(failures=1)
+    with pytest.raises(ValueError):
+        await instance.cached
+    await asyncio.sleep(0.06)
+    assert await instance.cached == 'bar'
+    assert instance.__async_property__.errors is None
+
+
+async def test_setter_clears_error():
+    instance = MyModel()
+    with pytest.raises(ValueError):
+        await instance.cached
+    instance.cached = 'abc'
+    del instance.cached
+    instance.failures = 0
+    assert await instance.cached == 'bar'
+
+
+async def test_retry_succeeds():
+    instance = MyModel(failures=2)
+    assert await instance.retried == 'bar'
+    assert instance.num_calls == 3
+
+
+async def test_retry_gives_up():
+    instance = MyModel(failures=3)
+    with pytest.raises(ValueError):
+        await instance.retried
+    assert instance.num_calls == 3
+
+
+async def test_retry_on():
+    instance = MyModel(failures=1)
+    with pytest.raises(ValueError):
+        await instance.not_retried
+    assert instance.num_calls == 1
+
+
+async def test_retry_delay():
+    for attempt in range(5):
+        delay = MyModel.retried.get_retry_delay(attempt)
+        assert 0 <= delay <= 0.001 * 2 ** attempt
@@ -0,0 +1,126 @@
+import asyncio
+import concurrent.futures
+import os
+import pickle
+import threading
+from copy import deepcopy
+
+import pytest
+
+from async_property import AwaitLoader, async_cached_property
+from async_property.cached import get_process_pool, shutdown_process_pool
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel(AwaitLoader):
+    def __init__(self, data=b'data'):
+        self.data = data
+        self.calls = 0
+
+    @async_cached_property(executor='thread')
+    def thread_name(self):
+        self.calls += 1
+        return threading.current_thread().name
+
+    @async_cached_property(executor='process')
+    def pid(self):
+        return os.getpid()
+
+    @async_cached_property(executor='thread', ttl=10)
+    def size(self):
+        return len(self.data)
+
+
+pool = concurrent.futures.ThreadPoolExecutor(thread_name_prefix='custom')
+
+
+class CustomPool:
+    @async_cached_property(executor=pool)
+    def thread_name(self):
+        return threading.current_thread().name
+
+
+async def test_thread():
+    instance = MyModel()
+    name = await instance.thread_name
+    assert name != threading.current_thread().name
+    assert instance.thread_name == name
+
+
+async def test_single_flight():
+    instance = MyModel()
+    await asyncio.gather(*(instance.thread_name for _ in range(10)))
+    assert instance.calls == 1
+
+
+async def test_process():
+    instance = MyModel()
+    assert await instance.pid != os.getpid()
+
+
+async def test_process_does_not_send_state():
+    instance = MyModel()
+    # not picklable, so the load fails if the state is sent along
+    instance.thread_name = threading.Lock()
+    assert await instance.pid != os.getpid()
+    assert set(instance.__async_property__) == {'thread_name', 'pid'}
+
+
+async def test_shutdown_process_pool():
+    pool = get_process_pool()
+    assert get_process_pool() is pool
+    shutdown_process_pool()
+    assert get_process_pool() is not pool
+    assert await MyModel().pid != os.getpid()
+
+
+async def test_custom_executor():
+    name = await CustomPool().thread_name
+    assert name.startswith('custom')
+
+
+async def test_await_loader():
+    instance = await MyModel(b'12345')
+    assert instance.size == 5
+    assert instance.pid != os.getpid()
+
+
+async def test_setter_keeps_executor():
+    @MyModel.size.setter
+    def size(self, value):
+        pass
+
+    assert size.executor == 'thread'
+
+
+async def test_requires_sync_function():
+    with pytest.raises(AssertionError):
+        @async_cached_property(executor='thread')
+        async def foo(self):
+            pass
+
+    with pytest.raises(AssertionError):
+        @async_cached_property
+        def bar(self):
+            pass
+
+
+async def test_invalid_executor():
+    with pytest.raises(AssertionError, match='executor must be'):
+        @async_cached_property(executor='fork')
+        def foo(self):
+            pass
+
+
+async def test_pickle_keeps_cached_values():
+    instance = MyModel(b'123')
+    await instance.size
+    pending = asyncio.ensure_future(instance.thread_name)
+    await asyncio.sleep(0)
+    for copy in (pickle.loads(pickle.dumps(instance)), deepcopy(instance)):
+        state = copy.__async_property__
+        assert dict(state) == {'size': 3}
+        assert state.expires == instance.__async_property__.expires
+        assert state.pending is None and state.errors is None
+    await pending
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from async_property import async_cached_property, AwaitLoader, gather_loaded
+
+pytestmark = pytest.mark.asyncio
+
+
+class Tracker:
+    running = 0
+    max_running = 0
+
+
+class MyModel(AwaitLoader):
+    def __init__(self, id, delay=0.01):
+        self.id = id
+        self.delay = delay
+
+    async def track(self):
+        Tracker.running += 1
+        Tracker.max_running = max(Tracker.max_running, Tracker.running)
+        await asyncio.sleep(self.delay)
+        Tracker.running -= 1
+        return self.id
+
+    @async_cached_property
+    async def first(self):
+        return await self.track()
+
+    @async_cached_property
+    async def second(self):
+        return await self.track()
+
+
+class FailingModel(AwaitLoader):
+    async def load(self):
+        raise ValueError('failed')
+
+
+@pytest.fixture(autouse=True)
+def reset_tracker():
+    Tracker.running = Tracker.max_running = 0
+
+
+async def test_yields_all_loaded():
+    instances = [MyModel(id) for id in range(20)]
+    loaded = [instance async for instance in gather_loaded(instances, 3)]
+    assert sorted(instance.id for instance in loaded) == list(range(20))
+    assert all(instance.first == instance.id for instance in loaded)
+    assert Tracker.max_running == 3
+
+
+async def test_yields_in_completion_order():
+    instances = [MyModel(1, delay=0.05), MyModel(2, delay=0.01)]
+    loaded = [instance.id async for instance in gather_loaded(instances)]
+    assert loaded == [2, 1]
+
+
+async def test_fields():
+    instances = [MyModel(id) for id in range(3)]
+    async for instance in gather_loaded(instances, fields=['second']):
+        assert set(instance.__async_property__) == {'second'}
+
+
+async def test_error_is_raised():
+    with pytest.raises(ValueError):
+        async for instance in gather_loaded([FailingModel()]):
+            pass
+
+
+async def test_early_exit_stops_loading():
+    instances = [MyModel(id, delay=0.05) for id in range(4)]
+    loaded = gather_loaded(instances, concurrency=1)
+    async for instance in loaded:
+        break
+    await loaded.aclose()
+    await asyncio.sleep(0.2)
+    # the load that held the limiter finishes, the queued ones never start
+    assert len(getattr(instances[1], '__async_property__', {})) <= 1
+    assert not any(
+        hasattr(instance, '__async_property__') for instance in instances[2:]
+    )
+
+
+async def test_slow_consumer_holds_back_workers():
+    instances = [MyModel(id, delay=0) for id in range(20)]
+    loaded = gather_loaded(instances, concurrency=2)
+    async for instance in loaded:
+        await asyncio.sleep(0.05)
+        break
+    started = [
+        instance for instance in instances
+        if hasattr(instance, '__async_property__')
+    ]
+    await loaded.aclose()
+    # one consumed, two queued and one waiting to be queued per worker
+    assert len(started) <= 5
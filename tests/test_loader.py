@@ -55,3 +55,34 @@ class MyModelWithLoad(AwaitLoader):
 async def test_call_load():
     instance = await MyModelWithLoad()
     assert instance.loaded == True
+
+
+class MyModelWithFields(AwaitLoader):
+    @async_cached_property
+    async def first(self):
+        return 1
+
+    @async_cached_property
+    async def second(self):
+        return 2
+
+    @async_cached_property
+    async def third(self):
+        return 3
+
+
+async def test_only():
+    instance = await MyModelWithFields().only('first', 'third', 'first')
+    assert set(instance.__async_property__) == {'first', 'third'}
+    assert instance.first == 1
+    assert instance.third == 3
+
+
+async def test_load_with_fields():
+    instance = await MyModelWithFields().load_with(fields=['second'])
+    assert set(instance.__async_property__) == {'second'}
+
+
+async def test_only_unknown_field():
+    with pytest.raises(ValueError):
+        await MyModelWithFields().only('first', 'missing')
@@ -0,0 +1,125 @@
+import asyncio
+import gc
+import weakref
+
+import pytest
+
+from async_property import async_cached_property
+
+pytestmark = pytest.mark.asyncio
+
+
+class Blob:
+    def __init__(self, size):
+        self.size = size
+
+
+class MyModel:
+    def __init__(self, size=1):
+        self.size = size
+
+    @async_cached_property(weak=True)
+    async def weak(self):
+        return Blob(self.size)
+
+    @async_cached_property(maxsize=2)
+    async def limited(self):
+        return Blob(self.size)
+
+    @async_cached_property(max_bytes=10, sizeof=lambda blob: blob.size)
+    async def sized(self):
+        return Blob(self.size)
+
+    @async_cached_property(maxsize=1000)
+    async def roomy(self):
+        return Blob(self.size)
+
+    @async_cached_property
+    async def big(self):
+        return Blob(self.size)
+
+
+async def test_weak_value():
+    instance = MyModel()
+    blob = await instance.weak
+    assert instance.weak == blob
+    assert await instance.weak is blob
+
+
+async def test_weak_value_collected():
+    instance = MyModel()
+    await instance.weak
+    await asyncio.sleep(0)
+    gc.collect()
+    assert 'weak' in instance.__async_property__
+    assert not MyModel.weak.has_cache_value(instance)
+    assert isinstance(await instance.weak, Blob)
+
+
+async def test_weak_falls_back_to_strong_reference():
+    class BuiltinModel:
+        calls = 0
+
+        @async_cached_property(weak=True)
+        async def blob(self):
+            BuiltinModel.calls += 1
+            return b'x' * 1000
+
+        @async_cached_property(weak=True)
+        async def nothing(self):
+            BuiltinModel.calls += 1
+
+    instance = BuiltinModel()
+    assert await instance.blob == b'x' * 1000
+    assert await instance.nothing is None
+    gc.collect()
+    assert instance.blob == b'x' * 1000
+    assert await instance.nothing is None
+    assert BuiltinModel.calls == 2
+
+
+async def test_maxsize_evicts_least_recently_used():
+    first, second, third = MyModel(), MyModel(), MyModel()
+    await first.limited
+    await second.limited
+    assert await first.limited
+    await third.limited
+    assert 'limited' in first.__async_property__
+    assert 'limited' not in second.__async_property__
+    assert 'limited' in third.__async_property__
+    assert len(MyModel.limited.size_limit.entries) == 2
+
+
+async def test_max_bytes():
+    instances = [MyModel(size=4) for _ in range(3)]
+    for instance in instances:
+        await instance.sized
+    assert MyModel.sized.size_limit.total_bytes == 8
+    assert 'sized' not in instances[0].__async_property__
+    big = MyModel(size=20)
+    await big.sized
+    assert MyModel.sized.size_limit.total_bytes == 20
+    assert 'sized' in big.__async_property__
+
+
+async def test_delete_updates_size():
+    instance = MyModel(size=3)
+    await instance.sized
+    total = MyModel.sized.size_limit.total_bytes
+    del instance.sized
+    assert MyModel.sized.size_limit.total_bytes == total - 3
+
+
+async def test_size_limit_does_not_keep_instances_alive():
+    instances = [MyModel(size=1) for _ in range(100)]
+    refs = []
+    for instance in instances:
+        await instance.roomy
+        refs.append(weakref.ref(await instance.big))
+    del instances, instance
+    await asyncio.sleep(0)
+    gc.collect()
+    assert not any(ref() is not None for ref in refs)
+    survivor = MyModel()
+    await survivor.roomy
+    assert len(MyModel.roomy.size_limit.entries) == 1
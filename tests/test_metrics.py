@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from async_property import async_cached_property, async_property, metrics
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel:
+    @async_property
+    async def plain(self):
+        return 'plain'
+
+    @async_cached_property
+    async def foo(self):
+        await asyncio.sleep(0.01)
+        return 'bar'
+
+    @async_cached_property
+    async def failing(self):
+        raise ValueError('failed')
+
+
+@pytest.fixture
+def collector():
+    collector = metrics.register(metrics.HistogramCollector())
+    yield collector
+    metrics.unregister(collector)
+
+
+def counts(collector):
+    return {
+        (row['field'], row['event']): row['count']
+        for row in collector.report()
+    }
+
+
+async def test_disabled_by_default():
+    assert metrics.callbacks == []
+
+
+async def test_hits_misses_and_loads(collector):
+    instance = MyModel()
+    await instance.foo
+    await instance.foo
+    assert counts(collector) == {
+        ('foo', 'miss'): 1,
+        ('foo', 'load'): 1,
+        ('foo', 'hit'): 1,
+    }
+    load = collector.get(MyModel, 'foo', metrics.LOAD)
+    assert load.total >= 0.01
+    assert load.quantile(0.5) >= 0.01
+
+
+async def test_dedup_and_wait(collector):
+    instance = MyModel()
+    await asyncio.gather(instance.foo, instance.foo, instance.foo)
+    assert counts(collector)[('foo', 'dedup')] == 2
+    assert collector.get(MyModel, 'foo', metrics.WAIT).count == 2
+
+
+async def test_errors(collector):
+    with pytest.raises(ValueError):
+        await MyModel().failing
+    assert counts(collector)[('failing', 'error')] == 1
+
+
+async def test_async_property(collector):
+    assert await MyModel().plain == 'plain'
+    assert counts(collector) == {('plain', 'load'): 1}
+
+
+async def test_custom_callback():
+    events = []
+
+    def callback(event, owner, field_name, value):
+        events.append((event, owner, field_name))
+
+    metrics.register(callback)
+    try:
+        instance = MyModel()
+        instance.foo = 'abc'
+        assert instance.foo == 'abc'
+    finally:
+        metrics.unregister(callback)
+    assert events == [(metrics.HIT, MyModel, 'foo')]
+
+
+async def test_histogram():
+    histogram = metrics.Histogram((1, 2, 3))
+    for value in (0.5, 1.5, 1.5, 2.5, 10):
+        histogram.observe(value)
+    assert histogram.count == 5
+    assert histogram.quantile(0.5) == 2
+    assert histogram.quantile(1) == 10
+    assert histogram.mean == pytest.approx(3.2)
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+
+import pytest
+
+from async_property import async_cached_property
+from async_property.cached import AsyncSharedCachedPropertyDescriptor
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel:
+    calls = []
+
+    def __init__(self, id):
+        self.id = id
+
+    @async_cached_property(shared_key=lambda self: self.id, maxsize=2)
+    async def foo(self):
+        await asyncio.sleep(0.01)
+        self.calls.append(self.id)
+        return f'foo-{self.id}'
+
+
+@pytest.fixture(autouse=True)
+def reset_model():
+    MyModel.calls.clear()
+    MyModel.foo.shared_cache.clear()
+
+
+async def test_descriptor():
+    assert isinstance(MyModel.foo, AsyncSharedCachedPropertyDescriptor)
+    assert MyModel.foo.maxsize == 2
+
+
+async def test_shared_between_instances():
+    assert await MyModel(1).foo == 'foo-1'
+    instance = MyModel(1)
+    assert instance.foo == 'foo-1'
+    assert await instance.foo == 'foo-1'
+    assert MyModel.calls == [1]
+    assert not hasattr(instance, '__async_property__')
+
+
+async def test_concurrent_loads_deduplicated():
+    values = await asyncio.gather(*[MyModel(1).foo for _ in range(5)])
+    assert values == ['foo-1'] * 5
+    assert MyModel.calls == [1]
+
+
+async def test_more_concurrent_keys_than_maxsize():
+    values = await asyncio.gather(*[MyModel(i).foo for i in range(5)])
+    assert values == [f'foo-{i}' for i in range(5)]
+    assert sorted(MyModel.calls) == list(range(5))
+    assert list(MyModel.foo.shared_cache) == [3, 4]
+    assert all(
+        state.pending is None for state in MyModel.foo.shared_cache.values()
+    )
+
+
+async def test_lru_eviction():
+    for id in (1, 2, 3):
+        await MyModel(id).foo
+    assert list(MyModel.foo.shared_cache) == [2, 3]
+    await MyModel(1).foo
+    assert MyModel.calls == [1, 2, 3, 1]
+
+
+async def test_setter_and_deleter():
+    instance = MyModel(1)
+    instance.foo = 'abc'
+    assert MyModel(1).foo == 'abc'
+    del instance.foo
+    assert await MyModel(1).foo == 'foo-1'
+
+
+async def test_hit_does_not_wait_for_lock():
+    instance = MyModel(1)
+    await instance.foo
+    cache = MyModel.foo.shared_cache
+    states = []
+    with cache.lock:
+        thread = threading.Thread(
+            target=lambda: states.append(cache.get_or_create(1, dict))
+        )
+        thread.start()
+        thread.join(1)
+        assert len(states) == 1
+    thread.join()
+    assert states[0]['foo'] == 'foo-1'
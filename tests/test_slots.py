@@ -0,0 +1,60 @@
+import pytest
+
+from async_property import async_cached_property, AwaitLoader
+from async_property.cached import AsyncCachedPropertyInstanceState
+
+pytestmark = pytest.mark.asyncio
+
+
+class SlotsLoader(AwaitLoader):
+    __slots__ = 'id',
+
+    def __init__(self, id):
+        self.id = id
+
+    @async_cached_property
+    async def foo(self):
+        return self.id * 2
+
+
+class SlotsModel:
+    __slots__ = '__async_property__',
+
+    @async_cached_property
+    async def foo(self):
+        return 'bar'
+
+
+class MissingSlotModel:
+    __slots__ = ()
+
+    @async_cached_property
+    async def foo(self):
+        return 'bar'
+
+
+async def test_loader_adds_slot():
+    assert '__async_property__' in SlotsLoader.__slots__
+    instance = await SlotsLoader(2)
+    assert not hasattr(instance, '__dict__')
+    assert instance.foo == 4
+
+
+async def test_slots_model():
+    instance = SlotsModel()
+    assert await instance.foo == 'bar'
+    assert instance.foo == 'bar'
+
+
+async def test_missing_slot():
+    with pytest.raises(AttributeError, match='__slots__'):
+        await MissingSlotModel().foo
+
+
+async def test_instance_state():
+    instance = await SlotsLoader(1)
+    state = instance.__async_property__
+    assert isinstance(state, AsyncCachedPropertyInstanceState)
+    assert state.cache is state
+    assert state.expires is None
+    assert state.pending is None
@@ -0,0 +1,107 @@
+import json
+import time
+
+import pytest
+
+from async_property import AwaitLoader, async_cached_property
+
+pytestmark = pytest.mark.asyncio
+
+
+class Value:
+    pass
+
+
+class MyModel(AwaitLoader):
+    def __init__(self, id=1):
+        self.id = id
+        self.calls = 0
+
+    @async_cached_property
+    async def foo(self):
+        self.calls += 1
+        return f'foo{self.id}'
+
+    @async_cached_property
+    async def bar(self):
+        self.calls += 1
+        return [1, 2, 3]
+
+    @async_cached_property(ttl=10)
+    async def fresh(self):
+        self.calls += 1
+        return 'fresh'
+
+    @async_cached_property(weak=True)
+    async def weak(self):
+        self.calls += 1
+        return Value()
+
+
+class OtherModel(AwaitLoader):
+    @async_cached_property
+    async def foo(self):
+        return 'other'
+
+
+async def test_round_trip():
+    instance = await MyModel(id=5)
+    data = instance.snapshot()
+    assert isinstance(data, bytes)
+    restored = MyModel.from_snapshot(data, id=5)
+    await restored
+    assert restored.calls == 1  # only the weak field is reloaded
+    assert restored.foo == 'foo5'
+    assert await restored.bar == [1, 2, 3]
+    assert await restored.fresh == 'fresh'
+
+
+async def test_selected_fields():
+    instance = await MyModel()
+    restored = MyModel.from_snapshot(instance.snapshot(fields=['foo']))
+    await restored
+    assert restored.calls == 3
+    with pytest.raises(ValueError, match='Unknown'):
+        instance.snapshot(fields=['missing'])
+
+
+async def test_unloaded_and_weak_fields_skipped():
+    instance = MyModel()
+    await instance.only('foo', 'weak')
+    restored = MyModel.from_snapshot(instance.snapshot())
+    await restored
+    assert restored.calls == 3
+
+
+async def test_ttl_is_kept():
+    instance = await MyModel()
+    restored = MyModel.from_snapshot(instance.snapshot())
+    descriptor = MyModel.__dict__['fresh']
+    expires = descriptor.get_expires(restored)['fresh'] - time.monotonic()
+    assert 9 < expires <= 10
+
+
+async def test_expired_fields_skipped(monkeypatch):
+    instance = await MyModel()
+    data = instance.snapshot()
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 11)
+    restored = MyModel.from_snapshot(data)
+    await restored
+    assert restored.calls == 2  # fresh and weak are reloaded
+
+
+async def test_wrong_class():
+    data = (await OtherModel()).snapshot()
+    with pytest.raises(ValueError, match='OtherModel'):
+        MyModel.from_snapshot(data)
+
+
+async def test_custom_serializer():
+    instance = MyModel()
+    await instance.only('foo', 'bar')
+    data = instance.snapshot(serializer=json)
+    assert isinstance(data, str)
+    restored = MyModel.from_snapshot(data, serializer=json)
+    assert restored.foo == 'foo1'
+    assert restored.bar == [1, 2, 3]
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from async_property import async_cached_property
+from async_property.proxy import AwaitableOnly, AwaitableProxy
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel:
+    def __init__(self):
+        self.num_loaded = 0
+        self.errors = []
+
+    @async_cached_property(ttl=0.05, stale_while_revalidate=True)
+    async def foo(self):
+        await asyncio.sleep(0.05)
+        self.num_loaded += 1
+        return self.num_loaded
+
+
+async def test_first_load_waits():
+    instance = MyModel()
+    assert isinstance(instance.foo, AwaitableOnly)
+    assert await instance.foo == 1
+
+
+async def test_returns_stale_value():
+    instance = MyModel()
+    await instance.foo
+    await asyncio.sleep(0.06)
+    assert isinstance(instance.foo, AwaitableProxy)
+    assert await instance.foo == 1
+    assert instance.foo == 1
+    await asyncio.sleep(0.06)
+    assert instance.foo == 2
+
+
+async def test_refreshes_once():
+    instance = MyModel()
+    await instance.foo
+    await asyncio.sleep(0.06)
+    await asyncio.gather(*[instance.foo for _ in range(10)])
+    assert len(instance.__async_property__.pending) == 1
+    await asyncio.sleep(0.06)
+    assert instance.num_loaded == 2
+    assert not instance.__async_property__.pending
+
+
+def record_error(instance, exc):
+    instance.errors.append(exc)
+
+
+class FailingModel(MyModel):
+    @async_cached_property(
+        ttl=0.01,
+        stale_while_revalidate=True,
+        on_refresh_error=record_error,
+    )
+    async def foo(self):
+        self.num_loaded += 1
+        if self.num_loaded > 1:
+            raise ValueError('backend down')
+        return self.num_loaded
+
+
+async def test_refresh_error_hook():
+    instance = FailingModel()
+    await instance.foo
+    await asyncio.sleep(0.02)
+    assert instance.foo == 1
+    await asyncio.sleep(0.01)
+    assert len(instance.errors) == 1
+    assert isinstance(instance.errors[0], ValueError)
+    assert instance.foo == 1
+
+
+async def test_requires_ttl():
+    with pytest.raises(AssertionError):
+        class BadModel:
+            @async_cached_property(stale_while_revalidate=True)
+            async def foo(self):
+                return True
+
+
+async def test_stale_value_without_event_loop():
+    instance = MyModel()
+    await instance.foo
+    await asyncio.sleep(0.06)
+    value = await asyncio.get_event_loop().run_in_executor(
+        None, lambda: instance.foo
+    )
+    assert value == 1
+    assert instance.__async_property__.pending is None
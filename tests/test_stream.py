@@ -0,0 +1,160 @@
+import asyncio
+import pickle
+import traceback
+from copy import deepcopy
+
+import pytest
+
+from async_property import (
+    AwaitLoader,
+    async_cached_property,
+    async_stream_property,
+)
+from async_property.stream import AsyncStream
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel(AwaitLoader):
+    def __init__(self):
+        self.calls = 0
+        self.started = 0
+
+    @async_stream_property
+    async def rows(self):
+        self.started += 1
+        for i in range(3):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            yield i
+
+    @async_stream_property
+    async def failing(self):
+        yield 'first'
+        raise ValueError('failed')
+
+    @async_cached_property
+    async def cached_stream(self):
+        return AsyncStream(self.numbers())
+
+    async def numbers(self):
+        yield 1
+        yield 2
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+async def test_class_access():
+    assert MyModel.rows.field_name == 'rows'
+    assert MyModel.rows.__name__ == 'rows'
+
+
+async def test_async_for():
+    instance = MyModel()
+    assert await collect(instance.rows) == [0, 1, 2]
+    assert instance.calls == 3
+
+
+async def test_replay():
+    instance = MyModel()
+    assert await collect(instance.rows) == [0, 1, 2]
+    assert await collect(instance.rows) == [0, 1, 2]
+    assert await instance.rows == [0, 1, 2]
+    assert instance.started == 1
+    assert instance.calls == 3
+
+
+async def test_concurrent_consumers_share_stream():
+    instance = MyModel()
+    results = await asyncio.gather(*(collect(instance.rows) for _ in range(5)))
+    assert results == [[0, 1, 2]] * 5
+    assert instance.calls == 3
+
+
+async def test_late_subscriber_gets_prefix():
+    instance = MyModel()
+    stream = instance.rows.__aiter__()
+    assert await stream.__anext__() == 0
+    assert instance.calls == 1
+    assert await collect(instance.rows) == [0, 1, 2]
+    assert instance.calls == 3
+
+
+async def test_cancelled_consumer_does_not_stop_stream():
+    instance = MyModel()
+    task = asyncio.ensure_future(collect(instance.rows))
+    await asyncio.sleep(0.005)
+    task.cancel()
+    assert await collect(instance.rows) == [0, 1, 2]
+    assert instance.started == 1
+
+
+async def test_error_is_replayed():
+    instance = MyModel()
+    seen = []
+    for _ in range(2):
+        with pytest.raises(ValueError, match='failed'):
+            async for chunk in instance.failing:
+                seen.append(chunk)
+    assert seen == ['first', 'first']
+
+
+async def test_replayed_error_traceback_does_not_grow():
+    instance = MyModel()
+    errors, depths = [], []
+    for _ in range(3):
+        with pytest.raises(ValueError) as exc_info:
+            await instance.failing
+        errors.append(exc_info.value)
+        tb = exc_info.value.__traceback__
+        depths.append(len(traceback.extract_tb(tb)))
+    assert depths[1] == depths[2]
+    assert errors[1] is not errors[2]
+    assert errors[1].__cause__ is errors[2].__cause__
+
+
+async def test_pickle_leaves_out_streams():
+    instance = MyModel()
+    await instance.rows
+    await instance.cached_stream
+    instance.__async_property__['value'] = 'kept'
+    for copy in (pickle.loads(pickle.dumps(instance)), deepcopy(instance)):
+        assert dict(copy.__async_property__) == {'value': 'kept'}
+        assert await copy.rows == [0, 1, 2]
+        assert copy.started == 2
+
+
+async def test_delete_restarts():
+    instance = MyModel()
+    await instance.rows
+    del instance.rows
+    assert await instance.rows == [0, 1, 2]
+    assert instance.started == 2
+
+
+async def test_set_not_allowed():
+    instance = MyModel()
+    with pytest.raises(ValueError):
+        instance.rows = []
+
+
+async def test_not_loaded_by_await_loader():
+    instance = await MyModel()
+    assert instance.started == 0
+
+
+async def test_proxy_async_for():
+    instance = MyModel()
+    await instance.cached_stream
+    assert await collect(instance.cached_stream) == [1, 2]
+    iterator = instance.cached_stream.__aiter__()
+    assert await iterator.__anext__() == 1
+
+
+async def test_requires_async_generator():
+    with pytest.raises(AssertionError):
+        @async_stream_property
+        async def not_generator(self):
+            return 1
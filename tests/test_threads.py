@@ -0,0 +1,333 @@
+import asyncio
+import sys
+import threading
+
+import pytest
+
+from async_property import async_cached_property, async_stream_property
+from async_property.cached import get_loop, state_locks
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel:
+    def __init__(self):
+        self.calls = 0
+        self.loops = []
+
+    @async_cached_property
+    async def foo(self):
+        self.calls += 1
+        self.loops.append(asyncio.get_event_loop())
+        await asyncio.sleep(0.05)
+        return 'bar'
+
+    @async_cached_property(ttl=10)
+    async def fresh(self):
+        self.calls += 1
+        return 'fresh'
+
+    @async_cached_property(ttl=0.01, stale_while_revalidate=True)
+    async def refreshed(self):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return self.calls
+
+    @async_cached_property(cache_errors=10)
+    async def flaky(self):
+        self.calls += 1
+        raise ValueError('flaky')
+
+    @async_cached_property(maxsize=16)
+    async def limited(self):
+        return object()
+
+    @async_stream_property
+    async def rows(self):
+        self.calls += 1
+        yield 1
+
+    @async_cached_property
+    async def failing(self):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        raise ValueError('failed')
+
+
+def run_in_threads(target, count=4):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def run(index):
+        barrier.wait()
+        try:
+            results[index] = asyncio.run(target())
+        except Exception as exc:
+            results[index] = exc
+
+    threads = [
+        threading.Thread(target=run, args=(index,)) for index in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+async def test_loads_once_across_loops():
+    instance = MyModel()
+
+    async def get():
+        return await instance.foo
+
+    assert run_in_threads(get) == ['bar'] * 4
+    assert instance.calls == 1
+    assert await instance.foo == 'bar'
+
+
+async def test_error_shared_across_loops():
+    instance = MyModel()
+
+    async def get():
+        return await instance.failing
+
+    results = run_in_threads(get)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert instance.calls == 1
+
+
+async def test_load_restarts_when_owning_loop_stops():
+    instance = MyModel()
+    started = threading.Event()
+    result = []
+
+    async def start_and_leave():
+        MyModel.foo.start_load(instance)
+        await asyncio.sleep(0.01)
+        started.set()
+
+    async def wait():
+        started.wait()
+        return await instance.foo
+
+    owner = threading.Thread(target=asyncio.run, args=(start_and_leave(),))
+    waiter = threading.Thread(
+        target=lambda: result.append(asyncio.run(wait()))
+    )
+    waiter.start()
+    owner.start()
+    owner.join()
+    waiter.join()
+    assert result == ['bar']
+    assert instance.calls == 2
+    assert instance.loops[0] is not instance.loops[1]
+
+
+@pytest.fixture
+def switch_often():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+async def test_states_share_locks():
+    instances = [MyModel() for _ in range(200)]
+    for instance in instances:
+        instance.foo = 'foo'
+    locks = {id(instance.__async_property__.lock) for instance in instances}
+    assert locks <= {id(lock) for lock in state_locks}
+
+
+async def test_stress_instance_state(switch_often):
+    instances = [MyModel() for _ in range(200)]
+    seen = [[] for _ in instances]
+
+    def run():
+        for index, instance in enumerate(instances):
+            seen[index].append(MyModel.foo.get_instance_state(instance))
+            MyModel.fresh.get_expires(instance)
+            MyModel.rows.__get__(instance, MyModel)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for instance, states in zip(instances, seen):
+        assert all(state is instance.__async_property__ for state in states)
+        assert instance.__async_property__.expires == {}
+        assert await instance.rows == [1]
+        assert instance.calls == 1
+
+
+async def test_stress_loads_and_hits(switch_often):
+    instances = [MyModel() for _ in range(50)]
+
+    async def load():
+        for instance in instances:
+            await asyncio.gather(
+                instance.fresh, instance.limited,
+                instance.flaky, return_exceptions=True,
+            )
+            assert instance.fresh == 'fresh'
+        return True
+
+    assert run_in_threads(load, count=8) == [True] * 8
+    for instance in instances:
+        assert instance.calls == 2
+        state = instance.__async_property__
+        assert state.pending is None
+        assert set(state.expires) == {'fresh'}
+        assert set(state.errors) == {'flaky'}
+    assert len(MyModel.limited.size_limit.entries) == 16
+
+
+async def test_task_loop_without_get_loop():
+    class OldTask:
+        _loop = asyncio.get_event_loop()
+
+    assert get_loop(OldTask()) is asyncio.get_event_loop()
+
+
+class SharedModel:
+    def __init__(self, id):
+        self.id = id
+
+    @async_cached_property(shared_key=lambda self: self.id, maxsize=4)
+    async def foo(self):
+        return self.id
+
+
+async def test_stress_shared_cache(switch_often):
+    async def load():
+        for i in range(200):
+            assert await SharedModel(i % 8).foo == i % 8
+        return True
+
+    assert run_in_threads(load, count=8) == [True] * 8
+    cache = SharedModel.foo.shared_cache
+    assert len(cache) == 4
+    assert all(state.pending is None for state in cache.values())
+
+
+def close_stopped_loop(loop):
+    def close():
+        stalled = asyncio.all_tasks(loop)
+        for task in stalled:
+            task.cancel()
+        loop.run_until_complete(
+            asyncio.gather(*stalled, return_exceptions=True)
+        )
+        loop.close()
+
+    # the test's own loop is running in this thread
+    closer = threading.Thread(target=close)
+    closer.start()
+    closer.join()
+
+
+async def test_load_restarts_when_owning_loop_is_stopped():
+    instance = MyModel()
+    loop = asyncio.new_event_loop()
+    result = []
+
+    async def start():
+        MyModel.foo.start_load(instance)
+        await asyncio.sleep(0.01)
+
+    async def wait():
+        return await asyncio.wait_for(instance.foo, 2)
+
+    try:
+        owner = threading.Thread(
+            target=loop.run_until_complete, args=(start(),)
+        )
+        owner.start()
+        owner.join()
+        assert not loop.is_closed()
+        waiter = threading.Thread(
+            target=lambda: result.append(asyncio.run(wait()))
+        )
+        waiter.start()
+        waiter.join()
+    finally:
+        close_stopped_loop(loop)
+    assert result == ['bar']
+    assert instance.calls == 2
+    assert instance.foo == 'bar'
+    assert instance.__async_property__.pending is None
+
+
+async def test_refresh_restarts_when_owning_loop_is_stopped():
+    instance = MyModel()
+    instance.refreshed = 0
+    await asyncio.sleep(0.02)
+    loop = asyncio.new_event_loop()
+    result = []
+
+    async def read():
+        return instance.refreshed
+
+    async def refresh():
+        instance.refreshed
+        await asyncio.sleep(0.1)
+        return instance.refreshed
+
+    owner = threading.Thread(target=loop.run_until_complete, args=(read(),))
+    owner.start()
+    owner.join()
+    thread = threading.Thread(
+        target=lambda: result.append(asyncio.run(refresh()))
+    )
+    thread.start()
+    thread.join()
+    close_stopped_loop(loop)
+    assert result == [2]
+
+
+async def test_stress_ttl_writes_and_reads(switch_often):
+    writing = threading.Event()
+    read = threading.Event()
+
+    def sizeof(value):
+        # hold the writer between storing the value and finishing the
+        # write while another thread reads
+        writing.set()
+        read.wait(5)
+        return 1
+
+    class SizedModel:
+        @async_cached_property(ttl=10, max_bytes=100, sizeof=sizeof)
+        async def sized(self):
+            return 'loaded'
+
+    errors = []
+
+    def reader(instance):
+        writing.wait(5)
+        try:
+            while not read.is_set():
+                instance.sized
+                if SizedModel.sized.has_cache_value(instance):
+                    read.set()
+        except Exception as exc:
+            errors.append(exc)
+            read.set()
+
+    for _ in range(20):
+        writing.clear()
+        read.clear()
+        instance = SizedModel()
+        threads = [
+            threading.Thread(target=reader, args=(instance,))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        instance.sized = 'written'
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert instance.sized == 'written'
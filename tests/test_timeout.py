@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from async_property import async_cached_property, AwaitLoader
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel(AwaitLoader):
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.num_loaded = 0
+
+    @async_cached_property(timeout=0.1)
+    async def foo(self):
+        self.num_loaded += 1
+        await asyncio.sleep(self.delay)
+        return 'bar'
+
+
+class SlowLoader(AwaitLoader):
+    load_timeout = 0.05
+
+    @async_cached_property
+    async def foo(self):
+        await asyncio.sleep(0.2)
+        return 'bar'
+
+
+class SequentialLoader(AwaitLoader):
+    max_concurrency = 1
+    load_timeout = 0.05
+
+    def __init__(self):
+        self.started = []
+
+    async def track(self, field):
+        self.started.append(field)
+        await asyncio.sleep(0.1)
+        return field
+
+    @async_cached_property
+    async def a(self):
+        return await self.track('a')
+
+    @async_cached_property
+    async def b(self):
+        return await self.track('b')
+
+    @async_cached_property
+    async def c(self):
+        return await self.track('c')
+
+
+async def test_within_timeout():
+    instance = MyModel()
+    assert await instance.foo == 'bar'
+
+
+async def test_timeout():
+    instance = MyModel(delay=0.2)
+    with pytest.raises(asyncio.TimeoutError):
+        await instance.foo
+    assert 'foo' not in instance.__async_property__
+    assert instance.__async_property__.pending is None
+
+
+async def test_cancelled_waiter_does_not_cancel_load():
+    instance = MyModel()
+    first = asyncio.ensure_future(instance.foo)
+    second = asyncio.ensure_future(instance.foo)
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == 'bar'
+    assert first.cancelled()
+    assert instance.num_loaded == 1
+
+
+async def test_load_survives_all_waiters_cancelled():
+    instance = MyModel()
+    waiter = asyncio.ensure_future(instance.foo)
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    await asyncio.sleep(0.06)
+    assert instance.foo == 'bar'
+    assert instance.num_loaded == 1
+
+
+async def test_load_timeout():
+    with pytest.raises(asyncio.TimeoutError):
+        await SlowLoader()
+
+
+async def test_load_with_timeout():
+    with pytest.raises(asyncio.TimeoutError):
+        await MyModel(delay=0.08).load_with(timeout=0.01)
+
+
+async def test_load_with_zero_timeout():
+    with pytest.raises(asyncio.TimeoutError):
+        await MyModel(delay=0.01).load_with(timeout=0)
+
+
+async def test_load_timeout_stops_unstarted_fields():
+    instance = SequentialLoader()
+    with pytest.raises(asyncio.TimeoutError):
+        await instance
+    await asyncio.sleep(0.3)
+    assert instance.started == ['a']
+    assert set(instance.__async_property__) == {'a'}
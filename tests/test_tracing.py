@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from async_property import (
+    AwaitLoader,
+    async_cached_property,
+    async_property,
+    tracing,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel(AwaitLoader):
+    @async_property
+    async def plain(self):
+        return 'plain'
+
+    @async_cached_property
+    async def foo(self):
+        await asyncio.sleep(0.01)
+        return 'bar'
+
+    @async_cached_property
+    async def nested(self):
+        return await self.foo + '!'
+
+    @async_cached_property
+    async def failing(self):
+        raise ValueError('failed')
+
+
+@pytest.fixture
+def exporter():
+    exporter = tracing.set_tracer(tracing.InMemoryExporter())
+    yield exporter
+    tracing.set_tracer(None)
+
+
+def names(spans):
+    return sorted(span.attributes.get('field', span.name) for span in spans)
+
+
+async def test_disabled_by_default():
+    assert tracing.tracer is None
+    assert await MyModel().foo == 'bar'
+
+
+async def test_property_spans(exporter):
+    instance = MyModel()
+    await instance.plain
+    await instance.foo
+    await instance.foo
+    plain, miss = exporter.spans
+    assert plain.attributes == {'class': 'MyModel', 'field': 'plain'}
+    assert miss.attributes == {
+        'class': 'MyModel', 'field': 'foo', 'cache.hit': False, 'dedup': False,
+    }
+    assert miss.duration >= 0.01
+    assert miss.parent is None
+
+
+async def test_loaded_field_reports_hit(exporter):
+    instance = MyModel()
+    await instance.foo
+    await instance.only('foo')
+    hit = exporter.spans[1]
+    assert hit.attributes['cache.hit'] is True
+    assert hit.parent is exporter.spans[-1]
+
+
+async def test_dedup_attribute(exporter):
+    instance = MyModel()
+    await asyncio.gather(instance.foo, instance.foo)
+    assert [span.attributes['dedup'] for span in exporter.spans] == [
+        False, True,
+    ]
+
+
+async def test_nested_loads(exporter):
+    await MyModel().nested
+    foo, nested = exporter.spans
+    assert foo.parent is nested
+    assert foo.parent_id == nested.span_id
+
+
+async def test_loader_span_is_parent(exporter):
+    await MyModel().only('foo', 'nested')
+    load = exporter.spans[-1]
+    assert load.name == 'AwaitLoader.load'
+    assert load.attributes == {'class': 'MyModel'}
+    assert names(exporter.children(load)) == ['foo', 'nested']
+
+
+async def test_exception_recorded(exporter):
+    with pytest.raises(ValueError):
+        await MyModel().failing
+    span, = exporter.spans
+    assert isinstance(span.exception, ValueError)
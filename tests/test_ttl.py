@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from async_property import async_cached_property
+from async_property.proxy import AwaitableOnly, AwaitableProxy
+
+pytestmark = pytest.mark.asyncio
+
+
+class MyModel:
+    def __init__(self):
+        self.num_loaded = 0
+
+    @async_cached_property(ttl=0.05)
+    async def foo(self):
+        self.num_loaded += 1
+        return self.num_loaded
+
+
+async def test_descriptor():
+    assert MyModel.foo.ttl == 0.05
+    assert MyModel.foo.__name__ == 'foo'
+
+
+async def test_cached_until_expired():
+    instance = MyModel()
+    assert await instance.foo == 1
+    assert isinstance(instance.foo, AwaitableProxy)
+    assert await instance.foo == 1
+    await asyncio.sleep(0.06)
+    assert isinstance(instance.foo, AwaitableOnly)
+    assert await instance.foo == 2
+    assert instance.num_loaded == 2
+
+
+async def test_setter_resets_expiry():
+    instance = MyModel()
+    instance.foo = 'abc'
+    assert instance.foo == 'abc'
+    await asyncio.sleep(0.06)
+    assert await instance.foo == 1
+
+
+async def test_deleter():
+    instance = MyModel()
+    await instance.foo
+    del instance.foo
+    assert 'foo' not in instance.__async_property__.cache
+    assert 'foo' not in instance.__async_property__.expires
+
+
+class ModelWithSetter:
+    @async_cached_property(ttl=10)
+    async def foo(self):
+        return 'bar'
+
+    @foo.setter
+    def foo(self, value):
+        self.bar = value
+
+
+async def test_setter_keeps_ttl():
+    assert ModelWithSetter.foo.ttl == 10
+    instance = ModelWithSetter()
+    instance.foo = 'abc'
+    assert instance.bar == 'abc'